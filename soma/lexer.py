@@ -4,18 +4,27 @@ SOMA Lexer
 See the soma-lexer.md
 """
 
-from enum import Enum
+import functools
+import os
+import re
+import sys
+from bisect import bisect_right
+from enum import IntEnum
 
 
-class TokenKind(Enum):
-    INT = "INT"
-    PATH = "PATH"
-    EXEC = "EXEC"
-    STORE = "STORE"
-    LBRACE = "LBRACE"
-    RBRACE = "RBRACE"
-    STRING = "STRING"
-    EOF = "EOF"
+class TokenKind(IntEnum):
+    """
+    Token kinds. Small ints, so kind checks are plain integer compares;
+    use .name for display.
+    """
+    INT = 0
+    PATH = 1
+    EXEC = 2
+    STORE = 3
+    LBRACE = 4
+    RBRACE = 5
+    STRING = 6
+    EOF = 7
 
 
 class Token(object):
@@ -24,17 +33,34 @@ class Token(object):
 
     kind  - a TokenKind (INT, PATH, EXEC, STORE, EOF)
     value - the raw string for this token, as it appears in source
+            (decoded content for STRING tokens)
     line  - 1-based line number where the token starts
     col   - 1-based column number where the token starts
+    start - offset of the token's first character in the source
+    end   - offset just past the token's last character
+
+    The lexer creates PATH and INT tokens without a value; it is sliced out of
+    the source on first access, so tokens that are never inspected cost no
+    string allocation.
     """
 
-    __slots__ = ("kind", "value", "line", "col")
+    __slots__ = ("kind", "_value", "line", "col", "start", "end", "_source")
 
-    def __init__(self, kind, value, line, col):
+    def __init__(self, kind, value, line, col, source=None, start=None, end=None):
         self.kind = kind
-        self.value = value
+        self._value = value
         self.line = line
         self.col = col
+        self.start = start
+        self.end = end
+        self._source = source
+
+    @property
+    def value(self):
+        value = self._value
+        if value is None:
+            value = self._value = _intern(self._source[self.start:self.end])
+        return value
 
     def __repr__(self):
         return "Token(%s, %r, %d, %d)" % (
@@ -66,372 +92,372 @@ class LexError(Exception):
 
 _WHITESPACE_CHARS = (" ", "\t", "\n", "\r")
 
-# Punctuation characters that, by default, form their own tokens.
-# In this version, '>' and '!' are the active punctuation; others
-# (like '{', '}', etc.) will be added later.
-_PUNCTUATION_KINDS = {
-    ">": TokenKind.EXEC,
-    "!": TokenKind.STORE,
-    "{": TokenKind.LBRACE,
-    "}": TokenKind.RBRACE,
-}
+# Master scanner. At any position exactly one alternative applies, tried in
+# order, so a single match classifies the next token and finds its end:
+#
+#   WS       whitespace run (skipped)
+#   COMMENT  ')' at token start up to the line terminator (skipped)
+#   STRING   the opening '(' only; the body is decoded by _lex_string
+#   LBRACE / RBRACE
+#   MOD      '>' or '!' attached to a following token; a standalone '>' or
+#            '!' (before whitespace, '}' or EOF) falls through to PATH
+#   INT      optional sign and digits, ended by whitespace, a brace or EOF
+#   NUMERIC  digits followed by anything else: an illegal numeric literal
+#   PATH     everything else, up to whitespace or a brace
+#
+# The pattern is generated from this table and _WHITESPACE_CHARS, so the
+# alphabet is defined in one place. %(ws)s expands to the whitespace
+# characters, escaped for use inside a character class.
+# \d matches exactly the decimal digits that int() accepts.
+_TOKEN_PATTERNS = (
+    ("WS", r"[%(ws)s]+"),
+    ("COMMENT", r"\)[^\r\n]*"),
+    ("STRING", r"\("),
+    ("LBRACE", r"\{"),
+    ("RBRACE", r"\}"),
+    ("MOD", r"[>!](?=[^%(ws)s}])"),
+    ("INT", r"[+-]?\d+(?=[%(ws)s{}]|\Z)"),
+    ("NUMERIC", r"[+-]?\d+"),
+    ("PATH", r"[^%(ws)s{}]+"),
+)
+
+
+def _build_scanner():
+    """Generate and compile the master scanner from _TOKEN_PATTERNS."""
+    ws = re.escape("".join(_WHITESPACE_CHARS))
+    return re.compile("|".join(
+        "(?P<%s>%s)" % (name, pattern % {"ws": ws})
+        for name, pattern in _TOKEN_PATTERNS
+    ))
+
+
+_SCAN = _build_scanner()
+
+# Group numbers, in _TOKEN_PATTERNS order (m.lastindex).
+(_G_WS, _G_COMMENT, _G_STRING, _G_LBRACE, _G_RBRACE, _G_MOD, _G_INT,
+ _G_NUMERIC, _G_PATH) = range(1, len(_TOKEN_PATTERNS) + 1)
+
+_HEX_DIGITS = re.compile(r"[0-9a-fA-F]+")
+
+# A line ends at '\n', '\r' or '\r\n' (the same rule comments use).
+_NEWLINE = re.compile(r"\r\n?|\n")
+
+
+# Canonical copies of short token strings. Programs reuse a small vocabulary
+# of names ('_', '+', 'print', ...), so sharing one string object per name
+# keeps allocation down and lets later dict lookups hit on identity.
+_INTERN_MAX_LEN = 8
+
+_INTERN = {}
+
+for _s in (">", "!", "{", "}", "+", "-", "*", "/", "%", "<", "_",
+           "print", "chain", "choose", "block", "concat", "use",
+           "True", "False", "Nil", "Void"):
+    _INTERN[_s] = sys.intern(_s)
+del _s
+
+
+def _line_starts(source):
+    """
+    Return the offsets at which the second and later lines of source begin.
 
+    Built once per lex call so token positions can be derived on demand
+    instead of being maintained character by character.
+    """
+    return [m.end() for m in _NEWLINE.finditer(source)]
 
-def _is_whitespace(ch):
-    return ch in _WHITESPACE_CHARS
 
+def _pos_to_linecol(line_starts, i):
+    """
+    Convert a source offset to a 1-based (line, col) pair.
 
-def lex(source):
+    line_starts - the list returned by _line_starts(source)
+    """
+    line = bisect_right(line_starts, i)
+    if line == 0:
+        return 1, i + 1
+    return line + 1, i - line_starts[line - 1] + 1
+
+
+def _intern(s):
+    """
+    Return the canonical copy of a short token string.
+
+    Strings longer than _INTERN_MAX_LEN are returned unchanged.
+    """
+    if len(s) > _INTERN_MAX_LEN:
+        return s
+    cached = _INTERN.get(s)
+    if cached is None:
+        cached = _INTERN[s] = sys.intern(s)
+    return cached
+
+
+# Set SOMA_LEX_CACHE=0 in the environment to disable the lex cache.
+_LEX_CACHE_ENABLED = os.environ.get("SOMA_LEX_CACHE", "1") != "0"
+
+_LEX_CACHE_SIZE = 64
+
+
+def lex(source, cache=True):
     """
     Lex a SOMA source string into a list of Tokens.
 
     On success: returns a list of Token instances, ending with an EOF token.
     On error: raises LexError with a descriptive message and position.
+
+    Results for recently lexed sources (the stdlib, scripts run repeatedly)
+    are cached. The list is a fresh copy on every call; the Tokens in it are
+    shared and must not be modified. Pass cache=False when the tokens are
+    only needed once, so they are neither looked up nor kept.
     """
+    if cache and _LEX_CACHE_ENABLED:
+        return list(_lex_cached(source))
+    return _lex(source)
+
+
+@functools.lru_cache(maxsize=_LEX_CACHE_SIZE)
+def _lex_cached(source):
+    return tuple(_lex(source))
+
+
+def _lex(source):
+    """Lex source without consulting the cache. See lex()."""
+    # A plain list with a bound append: CPython already grows lists
+    # geometrically, and a pre-sized list filled through a manual index
+    # measured slower per token.
     tokens = []
-    line = 1
-    col = 1
+    try:
+        _scan_tokens(source, tokens)
+    except LexError:
+        # Errors are reported in source order: a bad modifier target before
+        # the failing position wins, as it would had the parser got that far.
+        for index, token in enumerate(tokens):
+            if token.kind == TokenKind.EXEC or token.kind == TokenKind.STORE:
+                check_modifier_target(tokens, index)
+        # The failing token may be the target of the last modifier: a string
+        # literal that did not lex is still a string literal target.
+        if tokens and source[tokens[-1].end] == "(":
+            modifier = tokens[-1]
+            if modifier.kind == TokenKind.EXEC or modifier.kind == TokenKind.STORE:
+                raise LexError(
+                    "Modifier '%s' cannot target a string literal" % modifier.value,
+                    modifier.line,
+                    modifier.col,
+                )
+        raise
+    return tokens
+
+
+def _scan_tokens(source, tokens):
+    """Append the Tokens of source to tokens, ending with an EOF token."""
     i = 0
     n = len(source)
-
-    def emit(kind, value, start_line, start_col):
-        tokens.append(Token(kind, value, start_line, start_col))
+    line_starts = _line_starts(source)
+
+    # Hot-loop lookups bound once as locals.
+    append = tokens.append
+    Token_ = Token
+    linecol = _pos_to_linecol
+    scan = _SCAN.match
+    INT = TokenKind.INT
+    PATH = TokenKind.PATH
+    EXEC = TokenKind.EXEC
+    STORE = TokenKind.STORE
+    LBRACE = TokenKind.LBRACE
+    RBRACE = TokenKind.RBRACE
+    STRING = TokenKind.STRING
 
     while i < n:
-        ch = source[i]
+        m = scan(source, i)
+        group = m.lastindex
 
-        # --- Skip whitespace ---
-        if _is_whitespace(ch):
-            if ch == "\n":
-                line += 1
-                col = 1
-            else:
-                col += 1
-            i += 1
+        # --- Whitespace and comments produce no tokens ---
+        if group <= _G_COMMENT:
+            i = m.end()
             continue
 
-        start_line = line
-        start_col = col
+        # Every remaining branch emits a token (or fails) at this position.
+        # _SCAN has already classified the token, so this chain only picks
+        # the branch for its group, most frequent first. A table of
+        # per-group handler functions measured slower: the extra call costs
+        # more than the few integer compares it replaces.
+        line, col = linecol(line_starts, i)
+
+        if group == _G_PATH:
+            j = m.end()
+            append(Token_(PATH, None, line, col, source, i, j))
+            i = j
+
+        elif group == _G_MOD:
+            # An attached modifier. Its target is lexed as a separate token
+            # in the next iteration; the parser checks that the target is
+            # one a modifier may apply to.
+            if source[i] == ">":
+                append(Token_(EXEC, ">", line, col, None, i, i + 1))
+            else:
+                append(Token_(STORE, "!", line, col, None, i, i + 1))
+            i += 1
 
-        # --- Comments: ')' starts a line comment outside strings ---
-        if ch == ")":
-            i, line, col = _skip_comment(source, i, line, col)
-            continue
+        elif group == _G_STRING:
+            value, j = _lex_string(source, i, line_starts)
+            append(Token_(STRING, value, line, col, None, i, j))
+            i = j
 
-        # --- String literal: ( ... ) with \HEX\ escapes ---
-        if ch == "(":
-            value, i, line, col = _lex_string(source, i, line, col)
-            emit(TokenKind.STRING, value, start_line, start_col)
-            continue
+        elif group == _G_INT:
+            j = m.end()
+            append(Token_(INT, None, line, col, source, i, j))
+            i = j
 
-        # --- Braces are always structural ---
-        if ch == "{":
-            emit(TokenKind.LBRACE, "{", start_line, start_col)
+        elif group == _G_LBRACE:
+            append(Token_(LBRACE, "{", line, col, None, i, i + 1))
             i += 1
-            col += 1
-            continue
 
-        if ch == "}":
-            emit(TokenKind.RBRACE, "}", start_line, start_col)
+        elif group == _G_RBRACE:
+            append(Token_(RBRACE, "}", line, col, None, i, i + 1))
             i += 1
-            col += 1
-            continue
 
-        # --- Modifier or plain punctuation at token start ('>' or '!') ---
-        if ch in (">", "!"):
-            # Look ahead one character
-            if (
-                i + 1 >= n
-                or _is_whitespace(source[i + 1])
-                or source[i + 1] == "}"
-            ):
-                # Standalone form: treat as plain PATH("!") or PATH(">")
-                emit(TokenKind.PATH, ch, start_line, start_col)
-                i += 1
-                col += 1
-                continue
-
-            # Attached modifier form: '!'foo or '>'foo
-            next_ch = source[i + 1]
-            second_ch = source[i + 2] if (i + 2) < n else None
-
-            # Forbid attaching modifiers to strings
-            if next_ch == "(":
-                raise LexError(
-                "Modifier '%s' cannot target a string literal" % ch,
-                start_line,
-                start_col,
-            )
-
-            # Special-case: '!{...}' is illegal: cannot store directly to a block.
-            if ch == "!" and next_ch == "{":
-                raise LexError(
-                    "Modifier '!' cannot target a block",
-                    start_line,
-                    start_col,
-                )
-
-            # 1) Forbid numeric-like targets:
-            #    If target starts with digit, or with +/- followed by digit,
-            #    we consider that "numeric-like" and reject.
-            if next_ch.isdigit() or (
-                next_ch in "+-"
-                and second_ch is not None
-                and second_ch.isdigit()
-            ):
-                raise LexError(
-                    "Modifier '%s' cannot target numeric-like token" % ch,
-                    start_line,
-                    start_col,
-                )
-
-            # 2) Forbid modifier-prefixed targets, except for the
-            #    single-character '!' or '>' case (e.g. >! or !>).
-            if next_ch in ("!", ">"):
-                # Allowed only if this is the last char in the token,
-                # i.e. immediately followed by EOF, whitespace,
-                # or structural punctuation like '}' or '{'.
-                if (
-                    (i + 2) < n
-                    and not _is_whitespace(source[i + 2])
-                    and source[i + 2] not in ("{", "}")
-                ):
+        else:
+            # Digits immediately followed by something other than
+            # whitespace, a brace or EOF. Directly after a modifier this is
+            # reported as a bad modifier target, at the modifier.
+            if tokens:
+                prev = tokens[-1]
+                if prev.end == i and (prev.kind == EXEC or prev.kind == STORE):
                     raise LexError(
-                        "Modifier '%s' cannot target '%s'..." % (ch, next_ch),
-                        start_line,
-                        start_col,
+                        "Modifier '%s' cannot target numeric-like token"
+                        % prev.value,
+                        prev.line,
+                        prev.col,
                     )
+            raise LexError(
+                "Illegal numeric literal starting at %r"
+                % source[i : m.end() + 1],
+                line,
+                col,
+            )
 
-            # If we reach here, we accept this as a modifier token.
-            # We only emit the modifier now; the target will be lexed
-            # as a separate PATH (or other token) in the next iteration.
-            if ch == ">":
-                emit(TokenKind.EXEC, ">", start_line, start_col)
-            else:
-                emit(TokenKind.STORE, "!", start_line, start_col)
+    # Append EOF token
+    line, col = linecol(line_starts, n)
+    append(Token_(TokenKind.EOF, "", line, col, None, n, n))
 
-            i += 1
-            col += 1
-            continue
 
-        # --- Candidate number? ---
-        # Rule: candidate if starts with digit,
-        # or starts with + / - and next char is digit.
-        if ch.isdigit() or (
-            ch in "+-"
-            and (i + 1) < n
-            and source[i + 1].isdigit()
-        ):
-            # Try to lex a signed or unsigned integer.
-            j = i
-
-            # Optional sign
-            if source[j] in "+-":
-                j += 1
-
-            # At least one digit must follow (guaranteed by the condition above)
-            while j < n and source[j].isdigit():
-                j += 1
-
-            # Now j points just after the last digit.
-            if j == n:
-                # End of input: valid integer.
-                value = source[i:j]
-                emit(TokenKind.INT, value, start_line, start_col)
-                col += (j - i)
-                i = j
-                continue
-
-            next_ch = source[j]
-
-            if _is_whitespace(next_ch) or next_ch in ("{", "}"):
-                # Whitespace or structural delimiter terminates the integer token: valid INT.
-                value = source[i:j]
-                emit(TokenKind.INT, value, start_line, start_col)
-                col += (j - i)
-                i = j
-                continue
-
-            # If we reach here, the character immediately after the digits
-            # is not whitespace, not a brace, and not EOF. That is illegal for a numeric literal.
-            raise LexError(
-                "Illegal numeric literal starting at %r" % source[i : j + 1],
-                start_line,
-                start_col,
-            )
+def check_modifier_target(tokens, index):
+    """
+    Check the token attached to the '>' or '!' modifier tokens[index].
 
-        # --- PATH token ---
-        # Not a candidate number, not EXEC/STORE punctuation at start.
-        # This token is a PATH, which ends at whitespace or structural punctuation
-        # like '{' or '}' (strings '(' will also be added later).
-        j = i
-        while j < n:
-            chj = source[j]
-            # Token ends if we hit whitespace
-            if _is_whitespace(chj):
-                break
-            # Or a structural delimiter (braces)
-            if chj in ("{", "}"):
-                break
-            j += 1
-
-        value = source[i:j]
-        emit(TokenKind.PATH, value, start_line, start_col)
-        col += (j - i)
-        i = j
+    The lexer emits EXEC/STORE for any modifier that is not followed by
+    whitespace, '}' or EOF; whether its target is allowed is checked here,
+    by the parser as it reaches each modifier. A modifier cannot target a
+    string literal, a numeric-like token or another modifier (unless that
+    one is applied to a block), and '!' cannot target a block.
 
-    # Append EOF token
-    emit(TokenKind.EOF, "", line, col)
-    return tokens
+    tokens may end early (the lexer checks the tokens it has when it hits
+    an error); a target or lookahead token that is missing is not checked.
+
+    Raises:
+        LexError at the offending modifier if the target is not allowed
+    """
+    modifier = tokens[index]
+    # Only tokens that start right after the modifier are attached to it
+    # (tokens built by hand carry no offsets).
+    if index + 1 >= len(tokens) or modifier.end is None:
+        return
+    target = tokens[index + 1]
+    if target.start != modifier.end:
+        return
+
+    kind = target.kind
+    if kind == TokenKind.PATH:
+        return
+    if kind == TokenKind.STRING:
+        message = "Modifier '%s' cannot target a string literal"
+    elif kind == TokenKind.INT:
+        message = "Modifier '%s' cannot target numeric-like token"
+    elif kind == TokenKind.LBRACE and modifier.kind == TokenKind.STORE:
+        message = "Modifier '%s' cannot target a block"
+    elif kind == TokenKind.EXEC or kind == TokenKind.STORE:
+        # A modifier may target a modifier that is itself applied to a
+        # block, as in '>>{...}'; '!' applied to the block is still the
+        # inner modifier's error, as in '>!{...}'.
+        if index + 2 < len(tokens):
+            after = tokens[index + 2]
+            if after.kind == TokenKind.LBRACE and after.start == target.end:
+                if kind == TokenKind.STORE:
+                    raise LexError(
+                        "Modifier '!' cannot target a block", target.line, target.col
+                    )
+                return
+        message = "Modifier '%%s' cannot target '%s'..." % target.value
+    else:
+        return
+    raise LexError(message % modifier.value, modifier.line, modifier.col)
 
 
-def _lex_string(source, i, line, col):
+def _lex_string(source, i, line_starts):
     """
     Lex a SOMA string literal starting at position i where source[i] == '('.
 
     Returns:
-        (value, new_i, new_line, new_col)
+        (value, new_i)
 
     value   - the decoded string content
     new_i   - index just after the closing ')'
-    new_line, new_col - updated line/col at that position
+
+    line_starts is only consulted to position a LexError.
 
     Raises:
         LexError on unterminated string or invalid \HEX\ escape.
     """
-    start_line = line
-    start_col = col
+    start = i
     n = len(source)
 
+    def error(message, pos):
+        line, col = _pos_to_linecol(line_starts, pos)
+        return LexError(message, line, col)
+
     # Skip the opening '('
     i += 1
-    col += 1
-
-    chars = []
-
-    while i < n:
-        ch = source[i]
-
-        if ch == ")":
-            # End of string
-            i += 1
-            col += 1
-            return "".join(chars), i, line, col
-
-        if ch == "\\":
-            # Start of a \HEX\ escape
-            esc_start_line = line
-            esc_start_col = col
-
-            i += 1
-            col += 1
-            if i >= n:
-                raise LexError(
-                    "Unterminated unicode escape in string",
-                    esc_start_line,
-                    esc_start_col,
-                )
-
-            esc_start = i
-
-            # Scan until the closing backslash
-            while i < n and source[i] != "\\":
-                ch2 = source[i]
-                if ch2 == "\n":
-                    line += 1
-                    col = 1
-                else:
-                    col += 1
-                i += 1
-
-            if i >= n:
-                raise LexError(
-                    "Unterminated unicode escape in string",
-                    esc_start_line,
-                    esc_start_col,
-                )
-
-            esc_text = source[esc_start:i]
-            if not esc_text:
-                raise LexError(
-                    "Empty unicode escape in string",
-                    esc_start_line,
-                    esc_start_col,
-                )
-
-            if not all(c in "0123456789abcdefABCDEF" for c in esc_text):
-                raise LexError(
-                    "Non-hex digit in unicode escape in string",
-                    esc_start_line,
-                    esc_start_col,
-                )
 
-            try:
-                codepoint = int(esc_text, 16)
-                chars.append(chr(codepoint))
-            except ValueError:
-                raise LexError(
-                    "Invalid unicode codepoint in string",
-                    esc_start_line,
-                    esc_start_col,
-                )
+    # Fast path: no escapes before the closing ')', so the body is one slice.
+    close = source.find(")", i)
+    if close >= 0 and source.find("\\", i, close) < 0:
+        return _intern(source[i:close]), close + 1
 
-            # Consume the closing backslash
-            i += 1
-            col += 1
-            continue
+    # Copy the literal runs between escapes as slices.
+    chunks = []
 
-        # Ordinary character inside string
-        chars.append(ch)
-        if ch == "\n":
-            line += 1
-            col = 1
-        else:
-            col += 1
-        i += 1
+    while True:
+        close = source.find(")", i)
+        esc_pos = source.find("\\", i, close if close >= 0 else n)
 
-    # We hit EOF without closing ')'
-    raise LexError(
-        "Unterminated string literal",
-        start_line,
-        start_col,
-    )
+        if esc_pos < 0:
+            if close < 0:
+                # We hit EOF without closing ')'
+                raise error("Unterminated string literal", start)
+            chunks.append(source[i:close])
+            return _intern("".join(chunks)), close + 1
 
+        chunks.append(source[i:esc_pos])
 
-def _skip_comment(source, i, line, col):
-    """
-    Skip a SOMA line comment starting at position i where source[i] == ')'.
+        # Scan to the closing backslash of the \HEX\ escape
+        esc_end = source.find("\\", esc_pos + 1)
+        if esc_end < 0:
+            raise error("Unterminated unicode escape in string", esc_pos)
 
-    A comment consumes ')' and all characters up to (but not including) the
-    first line terminator (\\n, \\r, or \\r\\n) or EOF.
+        esc_text = source[esc_pos + 1:esc_end]
+        if not esc_text:
+            raise error("Empty unicode escape in string", esc_pos)
 
-    Returns:
-        (new_i, new_line, new_col)
-    """
-    n = len(source)
-    # Consume the ')'
-    i += 1
-    col += 1
-
-    # Skip until line terminator or EOF
-    while i < n and source[i] not in ("\n", "\r"):
-        i += 1
-        col += 1
-
-    if i >= n:
-        # Comment ran to EOF
-        return i, line, col
-
-    # We hit some kind of newline
-    if source[i] == "\r":
-        i += 1
-        # Optional '\n' in CRLF
-        if i < n and source[i] == "\n":
-            i += 1
-    else:  # '\n'
-        i += 1
+        # int(..., 16) alone would also accept '0x', '_', signs and
+        # surrounding whitespace, so the digits are checked in C first.
+        if _HEX_DIGITS.fullmatch(esc_text) is None:
+            raise error("Non-hex digit in unicode escape in string", esc_pos)
 
-    line += 1
-    col = 1
-    return i, line, col
+        codepoint = int(esc_text, 16)
+        if codepoint > 0x10FFFF:
+            raise error("Invalid unicode codepoint in string", esc_pos)
+        chunks.append(chr(codepoint))
 
+        # Continue after the closing backslash
+        i = esc_end + 1
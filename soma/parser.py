@@ -6,8 +6,17 @@ Parses a token stream into an Abstract Syntax Tree (AST).
 See the ast-definition.md for the complete AST specification.
 """
 
+import functools
+from sys import intern
 from typing import List, Union
-from soma.lexer import Token, TokenKind
+from soma.lexer import Token, TokenKind, LexError, lex, check_modifier_target
+
+# Token kinds bound once at module level. Enum members are singletons, so
+# the parser compares kinds by identity.
+_INT, _STRING, _LBRACE, _RBRACE, _EXEC, _STORE, _PATH, _EOF = (
+    TokenKind.INT, TokenKind.STRING, TokenKind.LBRACE, TokenKind.RBRACE,
+    TokenKind.EXEC, TokenKind.STORE, TokenKind.PATH, TokenKind.EOF,
+)
 
 
 class ParseError(Exception):
@@ -33,6 +42,10 @@ class ParseError(Exception):
 
 
 # ==================== AST Node Classes ====================
+#
+# Every node except Program takes an optional location: a
+# (line, column, length) tuple for the source text it was parsed from.
+# Equality and hashing are structural and ignore location.
 
 
 class Program:
@@ -43,6 +56,8 @@ class Program:
         statements - List of statement nodes to execute
     """
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List):
         self.statements = statements
 
@@ -52,6 +67,9 @@ class Program:
     def __eq__(self, other):
         return isinstance(other, Program) and self.statements == other.statements
 
+    def __hash__(self):
+        return hash(("Program", tuple(self.statements)))
+
 
 class IntNode:
     """
@@ -61,6 +79,8 @@ class IntNode:
         value - The integer value
     """
 
+    __slots__ = ("value", "location")
+
     def __init__(self, value: int, location=None):
         self.value = value
         self.location = location
@@ -71,6 +91,9 @@ class IntNode:
     def __eq__(self, other):
         return isinstance(other, IntNode) and self.value == other.value
 
+    def __hash__(self):
+        return hash(("IntNode", self.value))
+
 
 class StringNode:
     """
@@ -80,6 +103,8 @@ class StringNode:
         value - The decoded string value
     """
 
+    __slots__ = ("value", "location")
+
     def __init__(self, value: str, location=None):
         self.value = value
         self.location = location
@@ -90,6 +115,9 @@ class StringNode:
     def __eq__(self, other):
         return isinstance(other, StringNode) and self.value == other.value
 
+    def __hash__(self):
+        return hash(("StringNode", self.value))
+
 
 class BlockNode:
     """
@@ -102,6 +130,8 @@ class BlockNode:
         body - List of statement nodes in the block
     """
 
+    __slots__ = ("body", "location")
+
     def __init__(self, body: List, location=None):
         self.body = body
         self.location = location
@@ -112,6 +142,9 @@ class BlockNode:
     def __eq__(self, other):
         return isinstance(other, BlockNode) and self.body == other.body
 
+    def __hash__(self):
+        return hash(("BlockNode", tuple(self.body)))
+
 
 class ValuePath:
     """
@@ -121,6 +154,8 @@ class ValuePath:
         components - List of path components (e.g., ["a", "b", "c"] for a.b.c)
     """
 
+    __slots__ = ("components", "location")
+
     def __init__(self, components: List[str], location=None):
         self.components = components
         self.location = location
@@ -131,6 +166,9 @@ class ValuePath:
     def __eq__(self, other):
         return isinstance(other, ValuePath) and self.components == other.components
 
+    def __hash__(self):
+        return hash(("ValuePath", tuple(self.components)))
+
 
 class ReferencePath:
     """
@@ -142,6 +180,8 @@ class ReferencePath:
         components - List of path components (trailing . not included)
     """
 
+    __slots__ = ("components", "location")
+
     def __init__(self, components: List[str], location=None):
         self.components = components
         self.location = location
@@ -152,6 +192,9 @@ class ReferencePath:
     def __eq__(self, other):
         return isinstance(other, ReferencePath) and self.components == other.components
 
+    def __hash__(self):
+        return hash(("ReferencePath", tuple(self.components)))
+
 
 class ExecNode:
     """
@@ -161,6 +204,8 @@ class ExecNode:
         target - Either a ValuePath or BlockNode to execute
     """
 
+    __slots__ = ("target", "location")
+
     def __init__(self, target: Union[ValuePath, BlockNode], location=None):
         self.target = target
         self.location = location
@@ -171,6 +216,9 @@ class ExecNode:
     def __eq__(self, other):
         return isinstance(other, ExecNode) and self.target == other.target
 
+    def __hash__(self):
+        return hash(("ExecNode", self.target))
+
 
 class StoreNode:
     """
@@ -180,6 +228,8 @@ class StoreNode:
         target - Either a ValuePath or ReferencePath where to store
     """
 
+    __slots__ = ("target", "location")
+
     def __init__(self, target: Union[ValuePath, ReferencePath], location=None):
         self.target = target
         self.location = location
@@ -190,10 +240,28 @@ class StoreNode:
     def __eq__(self, other):
         return isinstance(other, StoreNode) and self.target == other.target
 
+    def __hash__(self):
+        return hash(("StoreNode", self.target))
+
 
 # ==================== Parser Class ====================
 
 
+def _source_length(token: Token) -> int:
+    """
+    Length of a token's source text.
+
+    Uses the lexer's offsets, so a STRING counts its delimiters and escapes
+    as written; tokens built without offsets fall back to the value length
+    (plus the two delimiters for a STRING).
+    """
+    if token.start is not None and token.end is not None:
+        return token.end - token.start
+    if token.kind is _STRING:
+        return len(token.value) + 2
+    return len(token.value)
+
+
 class Parser:
     """
     Recursive descent parser for SOMA.
@@ -211,6 +279,10 @@ class Parser:
         self.tokens = tokens
         self.current = 0
 
+        # Integer value for each distinct INT token text seen so far.
+        # Programs repeat the same few literals, so most lookups skip int().
+        self._int_cache = {}
+
     def parse(self) -> Program:
         """
         Parse the token stream into a Program AST node.
@@ -220,14 +292,82 @@ class Parser:
 
         Raises:
             ParseError if the token stream contains invalid syntax
+            LexError if a modifier anywhere in the stream has an invalid target
         """
-        statements = []
-        while not self._is_at_end():
-            statements.append(self._parse_statement())
-        return Program(statements)
+        try:
+            return Program(self._parse_sequence(_EOF))
+        except ParseError:
+            # Modifier targets used to be rejected by the lexer, before any
+            # parsing, so such an error anywhere wins over a syntax error.
+            self._check_all_modifier_targets()
+            raise
 
     # ==================== Statement Parsing ====================
 
+    def _parse_sequence(self, closing: TokenKind) -> List:
+        """
+        Parse statements up to (not including) a token of kind closing.
+
+        Shared by parse() (closing is EOF) and _parse_block (closing is
+        RBRACE). Integer and string literals are built inline and paths go
+        straight to _parse_path; only blocks and modifiers, which nest, go
+        through _parse_statement.
+
+        Returns:
+            List of statement nodes
+
+        Raises:
+            ParseError if EOF is reached before the closing token
+        """
+        # Kinds are read straight off the tokens: Token.kind is a slot, and
+        # a parallel list of kinds built in __init__ measured slower overall
+        # than the attribute reads it saves.
+        #
+        # The AST classes stay globals, as module-level classes and
+        # singletons do throughout soma: CPython 3.11 specialises LOAD_GLOBAL
+        # with a cached dict lookup, so binding them as default arguments or
+        # locals measured no faster here, nor in the VM's hot paths.
+        tokens = self.tokens
+        int_cache = self._int_cache
+        body = []
+        append = body.append
+        i = self.current
+
+        while True:
+            token = tokens[i]
+            kind = token.kind
+            if kind is _PATH:
+                self.current = i
+                append(self._parse_path())
+                i = self.current
+            elif kind is _INT:
+                text = token.value
+                number = int_cache.get(text)
+                if number is None:
+                    number = int_cache[text] = int(text)
+                append(IntNode(number, (token.line, token.col, len(text))))
+                i += 1
+            elif kind is _STRING:
+                append(StringNode(
+                    token.value, (token.line, token.col, _source_length(token))
+                ))
+                i += 1
+            elif kind is closing:
+                break
+            elif kind is _EOF:
+                raise ParseError(
+                    "Unclosed block (missing '}')",
+                    token.line,
+                    token.col
+                )
+            else:
+                self.current = i
+                append(self._parse_statement())
+                i = self.current
+
+        self.current = i
+        return body
+
     def _parse_statement(self):
         """
         Parse a single statement.
@@ -246,33 +386,11 @@ class Parser:
         Raises:
             ParseError if no valid statement can be parsed
         """
-        if self._check(TokenKind.INT):
-            return self._parse_int()
-        elif self._check(TokenKind.STRING):
-            return self._parse_string()
-        elif self._check(TokenKind.LBRACE):
-            return self._parse_block()
-        elif self._check(TokenKind.EXEC):
-            return self._parse_exec()
-        elif self._check(TokenKind.STORE):
-            return self._parse_store()
-        elif self._check(TokenKind.PATH):
-            return self._parse_path()
-        elif self._check(TokenKind.RBRACE):
-            # Unexpected closing brace
-            token = self._peek()
-            raise ParseError(
-                "Unexpected '}' without matching '{'",
-                token.line,
-                token.col
-            )
-        else:
-            token = self._peek()
-            raise ParseError(
-                "Unexpected token: %s" % token.kind.value,
-                token.line,
-                token.col
-            )
+        token = self.tokens[self.current]
+        handler = self._stmt_dispatch.get(token.kind)
+        if handler is not None:
+            return handler(self)
+        self._raise_unexpected(token)
 
     def _parse_int(self) -> IntNode:
         """
@@ -284,8 +402,12 @@ class Parser:
         Raises:
             ParseError if the current token is not an INT
         """
-        token = self._expect(TokenKind.INT)
-        return IntNode(int(token.value))
+        token = self._expect(_INT)
+        text = token.value
+        number = self._int_cache.get(text)
+        if number is None:
+            number = self._int_cache[text] = int(text)
+        return IntNode(number, (token.line, token.col, len(text)))
 
     def _parse_string(self) -> StringNode:
         """
@@ -299,8 +421,10 @@ class Parser:
         Raises:
             ParseError if the current token is not a STRING
         """
-        token = self._expect(TokenKind.STRING)
-        return StringNode(token.value)
+        token = self._expect(_STRING)
+        return StringNode(
+            token.value, (token.line, token.col, _source_length(token))
+        )
 
     def _parse_block(self) -> BlockNode:
         """
@@ -315,21 +439,17 @@ class Parser:
         Raises:
             ParseError if the block is not properly closed
         """
-        self._expect(TokenKind.LBRACE)
-        body = []
-
-        while not self._check(TokenKind.RBRACE):
-            if self._is_at_end():
-                token = self._peek()
-                raise ParseError(
-                    "Unclosed block (missing '}')",
-                    token.line,
-                    token.col
-                )
-            body.append(self._parse_statement())
+        open_brace = self._expect(_LBRACE)
+        body = self._parse_sequence(_RBRACE)
 
-        self._expect(TokenKind.RBRACE)
-        return BlockNode(body)
+        # Consume the '}'
+        close_brace = self.tokens[self.current]
+        self.current += 1
+        if open_brace.start is not None and close_brace.end is not None:
+            length = close_brace.end - open_brace.start
+        else:
+            length = 2
+        return BlockNode(body, (open_brace.line, open_brace.col, length))
 
     # ==================== Path Parsing ====================
 
@@ -350,21 +470,29 @@ class Parser:
         Raises:
             ParseError for invalid path syntax (e.g., "_temp" without dot)
         """
-        token = self._expect(TokenKind.PATH)
+        token = self._expect(_PATH)
         value = token.value
-        is_reference = False
 
-        # Check for trailing dot (indicates ReferencePath)
-        if value.endswith("."):
-            is_reference = True
+        # Check for trailing dot (indicates ReferencePath). The lexer never
+        # produces an empty PATH, so value[-1] is safe.
+        is_reference = value[-1] == "."
+        if is_reference:
             # Strip trailing dot before splitting
             value = value[:-1]
 
-        # Split by . to get components
-        components = value.split(".")
+        # Split by . to get components. Programs reuse a small vocabulary of
+        # names, so components are interned: one string object per name, and
+        # later dict lookups on them hit on identity. Most paths are a single
+        # name and skip the split.
+        if "." not in value:
+            components = [intern(value)]
+            empty_component = not value
+        else:
+            components = [intern(c) for c in value.split(".")]
+            empty_component = "" in components
 
         # Validate components are non-empty
-        if any(c == "" for c in components):
+        if empty_component:
             raise ParseError(
                 "Empty path component in '%s'" % token.value,
                 token.line,
@@ -374,10 +502,12 @@ class Parser:
         # Validate register paths
         self._validate_register_path(components, token)
 
+        location = (token.line, token.col, len(token.value))
+
         if is_reference:
-            return ReferencePath(components)
+            return ReferencePath(components, location)
         else:
-            return ValuePath(components)
+            return ValuePath(components, location)
 
     def _validate_register_path(self, components: List[str], token: Token):
         """
@@ -396,12 +526,17 @@ class Parser:
         Raises:
             ParseError if the path uses invalid register syntax
         """
-        # Check if single component starts with _ but is not exactly "_"
-        if len(components) == 1 and components[0].startswith("_") and components[0] != "_":
+        # Only a single component can be a bare register name
+        if len(components) != 1:
+            return
+
+        # Check if the component starts with _ but is not exactly "_"
+        component = components[0]
+        if component[:1] == "_" and component != "_":
             raise ParseError(
                 "Invalid register syntax: '%s'. Register paths must use '_.%s' (with dot), not '%s' (without dot)" % (
                     token.value,
-                    components[0][1:],
+                    component[1:],
                     token.value
                 ),
                 token.line,
@@ -427,28 +562,29 @@ class Parser:
         Raises:
             ParseError if target is invalid (e.g., ReferencePath)
         """
-        self._expect(TokenKind.EXEC)
+        modifier = self._expect(_EXEC)
+        check_modifier_target(self.tokens, self.current - 1)
+        location = (modifier.line, modifier.col, 1)
+        token = self.tokens[self.current]
 
         # Check for block target
-        if self._check(TokenKind.LBRACE):
+        if token.kind is _LBRACE:
             block = self._parse_block()
-            return ExecNode(block)
+            return ExecNode(block, location)
 
         # Must be a path target
-        if self._check(TokenKind.PATH):
+        if token.kind is _PATH:
             path = self._parse_path()
             # Cannot execute a ReferencePath
             if isinstance(path, ReferencePath):
-                token = self.tokens[self.current - 1]  # Get the PATH token we just consumed
                 raise ParseError(
                     "Cannot execute a reference path (path with trailing '.')",
                     token.line,
                     token.col
                 )
-            return ExecNode(path)
+            return ExecNode(path, location)
 
         # No valid target
-        token = self._peek()
         raise ParseError(
             "Expected path or block after '>'",
             token.line,
@@ -469,11 +605,12 @@ class Parser:
         Raises:
             ParseError if no path follows the ! token
         """
-        self._expect(TokenKind.STORE)
+        modifier = self._expect(_STORE)
+        check_modifier_target(self.tokens, self.current - 1)
 
         # Must be a path target
-        if not self._check(TokenKind.PATH):
-            token = self._peek()
+        token = self.tokens[self.current]
+        if token.kind is not _PATH:
             raise ParseError(
                 "Expected path after '!'",
                 token.line,
@@ -481,7 +618,19 @@ class Parser:
             )
 
         path = self._parse_path()
-        return StoreNode(path)
+        return StoreNode(path, (modifier.line, modifier.col, 1))
+
+    def _check_all_modifier_targets(self):
+        """
+        Run check_modifier_target on every modifier in the token stream.
+
+        Raises:
+            LexError for the first modifier whose target is not allowed
+        """
+        tokens = self.tokens
+        for index, token in enumerate(tokens):
+            if token.kind is _EXEC or token.kind is _STORE:
+                check_modifier_target(tokens, index)
 
     # ==================== Helper Methods ====================
 
@@ -502,7 +651,7 @@ class Parser:
             The token that was consumed
         """
         token = self.tokens[self.current]
-        if not self._is_at_end():
+        if token.kind is not _EOF:
             self.current += 1
         return token
 
@@ -516,26 +665,7 @@ class Parser:
         Returns:
             True if current token matches, False otherwise
         """
-        if self._is_at_end():
-            return kind == TokenKind.EOF
-        return self._peek().kind == kind
-
-    def _match(self, *kinds: TokenKind) -> bool:
-        """
-        Check if the current token matches any of the given kinds.
-        If it matches, consume it and return True.
-
-        Args:
-            kinds - TokenKind values to check for
-
-        Returns:
-            True if matched and consumed, False otherwise
-        """
-        for kind in kinds:
-            if self._check(kind):
-                self._advance()
-                return True
-        return False
+        return self.tokens[self.current].kind is kind
 
     def _expect(self, kind: TokenKind) -> Token:
         """
@@ -550,14 +680,48 @@ class Parser:
         Raises:
             ParseError if current token doesn't match expected kind
         """
-        if not self._check(kind):
-            current = self._peek()
+        token = self.tokens[self.current]
+        if token.kind is not kind:
+            self._raise_expected(kind, token)
+        if kind is not _EOF:
+            self.current += 1
+        return token
+
+    # Error paths are kept in their own methods so the message formatting
+    # stays out of the frequently run code above.
+
+    def _raise_expected(self, kind: TokenKind, token: Token):
+        """
+        Raise the error for finding token where kind was expected.
+
+        Raises:
+            ParseError always
+        """
+        raise ParseError(
+            "Expected %s but found %s" % (kind.name, token.kind.name),
+            token.line,
+            token.col
+        )
+
+    def _raise_unexpected(self, token: Token):
+        """
+        Raise the error for a token that cannot start a statement.
+
+        Raises:
+            ParseError always
+        """
+        if token.kind is _RBRACE:
+            # Unexpected closing brace
             raise ParseError(
-                "Expected %s but found %s" % (kind.value, current.kind.value),
-                current.line,
-                current.col
+                "Unexpected '}' without matching '{'",
+                token.line,
+                token.col
             )
-        return self._advance()
+        raise ParseError(
+            "Unexpected token: %s" % token.kind.name,
+            token.line,
+            token.col
+        )
 
     def _is_at_end(self) -> bool:
         """
@@ -566,7 +730,19 @@ class Parser:
         Returns:
             True if at EOF, False otherwise
         """
-        return self._peek().kind == TokenKind.EOF
+        return self.tokens[self.current].kind is _EOF
+
+    # Statement parser for each token kind that can start a statement. Built
+    # once with the class; handlers are plain functions called with the
+    # parser.
+    _stmt_dispatch = {
+        _INT: _parse_int,
+        _STRING: _parse_string,
+        _LBRACE: _parse_block,
+        _EXEC: _parse_exec,
+        _STORE: _parse_store,
+        _PATH: _parse_path,
+    }
 
 
 # ==================== Public API ====================
@@ -592,17 +768,24 @@ def parse(source: str):
     Raises:
         ParseError if the source contains syntax errors
     """
-    from soma.lexer import lex
+    # Lex and parse (cached per source), then convert to a fresh
+    # dictionary representation the caller owns.
+    return _ast_to_dict(_parse_program(source))
 
-    # Lex the source
-    tokens = lex(source)
 
-    # Parse the token stream
-    parser = Parser(tokens)
-    program = parser.parse()
+@functools.lru_cache(maxsize=256)
+def _parse_program(source: str) -> Program:
+    """
+    Lex and parse source into a Program, caching recent results.
 
-    # Convert to dictionary representation
-    return _ast_to_dict(program)
+    Repeated parses of the same source (REPL sessions, reloads, test sweeps)
+    reuse the cached tree. The cache is safe to use from several threads,
+    but the returned Program is shared: callers must not modify it.
+
+    The tokens are not needed once the Program is cached, so they bypass the
+    lex cache and are freed as soon as parsing finishes.
+    """
+    return Parser(lex(source, cache=False)).parse()
 
 
 def _ast_to_dict(node):
@@ -611,55 +794,141 @@ def _ast_to_dict(node):
 
     The tests expect dictionaries with "kind", type-specific fields,
     and "location" information.
+
+    Iterative, so deeply nested blocks cannot hit the recursion limit. Each
+    container's dict is created with placeholder slots for its children;
+    leaves (including the path targets of exec and store nodes) are
+    converted as soon as they are seen, and other children are pushed on a
+    stack together with the slot (holder, key) they fill.
+
+    A BlockNode object reachable more than once (a shared subtree) is
+    converted once per call and its dict reused, keeping conversion linear
+    in the number of distinct nodes. Keys are object ids, which is safe
+    because the tree is alive for the whole call.
     """
-    if isinstance(node, Program):
-        return {
-            "kind": "Program",
-            "body": [_ast_to_dict(stmt) for stmt in node.statements],
-            "location": {"line": 1, "column": 1, "length": 0}
-        }
-    elif isinstance(node, IntNode):
-        return {
-            "kind": "IntNode",
-            "value": node.value,
-            "location": {"line": 1, "column": 1, "length": 1}
-        }
-    elif isinstance(node, StringNode):
-        return {
-            "kind": "StringNode",
-            "value": node.value,
-            "location": {"line": 1, "column": 1, "length": len(node.value) + 2}
-        }
-    elif isinstance(node, BlockNode):
-        return {
-            "kind": "BlockNode",
-            "body": [_ast_to_dict(stmt) for stmt in node.body],
-            "location": {"line": 1, "column": 1, "length": 2}
-        }
-    elif isinstance(node, ValuePath):
-        return {
-            "kind": "ValuePath",
-            "components": node.components,
-            "location": {"line": 1, "column": 1, "length": len(".".join(node.components))}
-        }
-    elif isinstance(node, ReferencePath):
-        return {
-            "kind": "ReferencePath",
-            "components": node.components,
-            "location": {"line": 1, "column": 1, "length": len(".".join(node.components)) + 1}
-        }
-    elif isinstance(node, ExecNode):
-        return {
-            "kind": "ExecNode",
-            "target": _ast_to_dict(node.target),
-            "location": {"line": 1, "column": 1, "length": 1}
-        }
-    elif isinstance(node, StoreNode):
-        return {
-            "kind": "StoreNode",
-            "target": _ast_to_dict(node.target),
-            "location": {"line": 1, "column": 1, "length": 1}
-        }
-    else:
-        raise ValueError("Unknown node type: %s" % type(node).__name__)
+    leaf_to_dict = _LEAF_TO_DICT
+    converted_blocks = {}
+    result = [None]
+    stack = [(node, result, 0)]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        node, holder, key = pop()
+        node_type = type(node)
+
+        to_dict = leaf_to_dict.get(node_type)
+        if to_dict is not None:
+            holder[key] = to_dict(node)
+
+        elif node_type is BlockNode or node_type is Program:
+            if node_type is BlockNode:
+                converted = converted_blocks.get(id(node))
+                if converted is not None:
+                    holder[key] = converted
+                    continue
+            if node_type is Program:
+                children = node.statements
+                location = {"line": 1, "column": 1, "length": 0}
+            else:
+                children = node.body
+                location = _location_to_dict(node.location or (1, 1, 2))
+            body = [None] * len(children)
+            holder[key] = converted_blocks[id(node)] = {
+                "kind": node_type.__name__,
+                "body": body,
+                "location": location
+            }
+            for index, child in enumerate(children):
+                to_dict = leaf_to_dict.get(type(child))
+                if to_dict is not None:
+                    body[index] = to_dict(child)
+                else:
+                    push((child, body, index))
+
+        elif node_type is ExecNode or node_type is StoreNode:
+            target = node.target
+            converted = holder[key] = {
+                "kind": node_type.__name__,
+                "target": None,
+                "location": _location_to_dict(node.location or (1, 1, 1))
+            }
+            to_dict = leaf_to_dict.get(type(target))
+            if to_dict is not None:
+                converted["target"] = to_dict(target)
+            else:
+                push((target, converted, "target"))
 
+        else:
+            raise ValueError("Unknown node type: %s" % node_type.__name__)
+
+    return result[0]
+
+
+def _location_to_dict(location):
+    """Dictionary form of a (line, column, length) location tuple."""
+    line, column, length = location
+    return {"line": line, "column": column, "length": length}
+
+
+def _path_length(components):
+    """Length of the dotted path text for components, without joining."""
+    length = len(components) - 1
+    for component in components:
+        length += len(component)
+    return length
+
+
+# Nodes built without a location (not by the parser) report line 1,
+# column 1 and a length estimated from the node itself. The leaf converters
+# build their location dicts inline: they run once per leaf, and a helper
+# call each time costs as much as building the dict. Path components are
+# copied, since the node may be a cached one shared with later parses.
+
+def _int_to_dict(node):
+    line, column, length = node.location or (1, 1, 1)
+    return {
+        "kind": "IntNode",
+        "value": node.value,
+        "location": {"line": line, "column": column, "length": length}
+    }
+
+
+def _string_to_dict(node):
+    line, column, length = node.location or (1, 1, len(node.value) + 2)
+    return {
+        "kind": "StringNode",
+        "value": node.value,
+        "location": {"line": line, "column": column, "length": length}
+    }
+
+
+def _value_path_to_dict(node):
+    line, column, length = (
+        node.location or (1, 1, _path_length(node.components))
+    )
+    return {
+        "kind": "ValuePath",
+        "components": list(node.components),
+        "location": {"line": line, "column": column, "length": length}
+    }
+
+
+def _reference_path_to_dict(node):
+    line, column, length = (
+        node.location or (1, 1, _path_length(node.components) + 1)
+    )
+    return {
+        "kind": "ReferencePath",
+        "components": list(node.components),
+        "location": {"line": line, "column": column, "length": length}
+    }
+
+
+# Dictionary converter for each leaf AST node class, keyed on the exact type.
+_LEAF_TO_DICT = {
+    IntNode: _int_to_dict,
+    StringNode: _string_to_dict,
+    ValuePath: _value_path_to_dict,
+    ReferencePath: _reference_path_to_dict,
+}
@@ -6,18 +6,24 @@ execute-fast model with RunNodes.
 
 Architecture:
 1. Parse source -> AST (handled by parser.py)
-2. Compile AST -> RunNodes (compile_program, compile_node)
-3. Execute RunNodes (VM.execute)
+2. Compile AST -> RunNodes (compile_program, compile_node), each holding
+   a short sequence of opcodes
+3. Execute the opcodes in one dispatch loop (VM.execute)
 
 This separates slow isinstance dispatch (compilation) from fast execution.
 """
 
-from typing import List, Union, Optional, Callable, Any
-from dataclasses import dataclass
-from enum import Enum, auto
+import importlib
+import operator
+import os
+from itertools import count
+from sys import intern
+from typing import List, Sequence, Union, Optional, Callable, Any
+from dataclasses import dataclass, field
 
+from soma.lexer import lex
 from soma.parser import (
-    Program, IntNode, StringNode, BlockNode, ValuePath, ReferencePath,
+    Parser, Program, IntNode, StringNode, BlockNode, ValuePath, ReferencePath,
     ExecNode, StoreNode
 )
 
@@ -38,15 +44,20 @@ class CompileError(Exception):
 # ==================== Value Types ====================
 
 
-class ThingType(Enum):
-    """Value type tags for runtime type checking."""
-    INT = auto()
-    STRING = auto()
-    BLOCK = auto()
-    NIL = auto()
-    VOID = auto()
-    CELLREF = auto()
-    FFI = auto()  # Foreign objects from invoke
+class ThingType:
+    """
+    Value type tags for runtime type checking.
+
+    Plain int constants rather than an Enum, so comparing tags is an int
+    compare with no Enum member lookup or __eq__ involved.
+    """
+    INT = 0
+    STRING = 1
+    BLOCK = 2
+    NIL = 3
+    VOID = 4
+    CELLREF = 5
+    FFI = 6  # Foreign objects from invoke
 
 
 class VoidSingleton:
@@ -128,7 +139,7 @@ True_ = TrueSingleton()
 False_ = FalseSingleton()
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     """
     Executable block (first-class value).
@@ -137,10 +148,25 @@ class Block:
     Blocks are immutable values that can be stored, passed around,
     and executed multiple times.
 
+    Block and BuiltinBlock are not meant to be subclassed: whether a value
+    is executable is decided by its exact type (see _EXECUTABLE_TYPES).
+
     Attributes:
         body: List of compiled RunNodes for the block body
+        ops: The body's opcodes, concatenated (see Op)
+        args: Operand for each opcode in ops
+        runs: How many times the body has run through the dispatch loop
+        fast_execute: The body as generated Python once it has run often
+            enough (see _generate_fast_execute), otherwise None
     """
     body: List['RunNode']
+    ops: List[int] = field(init=False, repr=False, compare=False)
+    args: List[Any] = field(init=False, repr=False, compare=False)
+    runs: int = field(default=0, init=False, repr=False, compare=False)
+    fast_execute: Optional[Callable] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.ops, self.args = _link(self.body)
 
     def execute(self, vm: 'VM'):
         """
@@ -153,25 +179,10 @@ class Block:
         Args:
             vm: The VM instance to execute in
         """
-        # Save current register and block context
-        saved_register = vm.register
-        saved_block = vm.current_block
+        _execute_ops(vm, self.ops, self.args, self)
 
-        # Create fresh Register for this block
-        vm.register = Register()
-        vm.current_block = self
 
-        try:
-            # Execute block body
-            for rn in self.body:
-                rn.execute(vm)
-        finally:
-            # Restore register (block-local state destroyed)
-            vm.register = saved_register
-            vm.current_block = saved_block
-
-
-@dataclass
+@dataclass(slots=True)
 class CellRef:
     """
     Reference to a Cell (not the value, the Cell itself).
@@ -180,6 +191,10 @@ class CellRef:
     The Cell persists as long as the CellRef exists (or the path exists
     in the Store/Register).
 
+    CellRef is not meant to be subclassed: writes test for it with
+    ``type(value) is CellRef`` rather than isinstance, and record the
+    result on the Cell (Cell._is_ref) for the path walks.
+
     Attributes:
         cell: The Cell being referenced
     """
@@ -189,7 +204,7 @@ class CellRef:
         return f"CellRef({id(self.cell)})"
 
 
-@dataclass
+@dataclass(slots=True)
 class BuiltinBlock:
     """
     Special Block for built-in operations.
@@ -212,6 +227,11 @@ class BuiltinBlock:
         return f"<builtin {self.name}>"
 
 
+# Exact types of executable values; testing type(x) in this set is one hash
+# probe, where isinstance with a tuple checks each class in turn
+_EXECUTABLE_TYPES = frozenset({Block, BuiltinBlock})
+
+
 # Thing type union - any value that can live on the AL or in a Cell
 Thing = Union[int, str, Block, VoidSingleton, NilSingleton, CellRef, BuiltinBlock, Any]
 
@@ -219,7 +239,7 @@ Thing = Union[int, str, Block, VoidSingleton, NilSingleton, CellRef, BuiltinBloc
 # ==================== Cell and Storage ====================
 
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     """
     A Cell in the hierarchical graph.
@@ -229,21 +249,79 @@ class Cell:
     - children: Dict of sub-paths to child Cells
 
     A Cell can have both a value and children simultaneously.
+
+    _is_ref mirrors ``type(value) is CellRef`` so path walks test one bool
+    per step. Every write of value keeps it in step.
     """
+    # children stays a plain dict even for cells with a handful of children.
+    # A linear scan over parallel key/cell lists runs in Python bytecode and
+    # measured about three times slower than dict.get for four interned
+    # keys, and the lists save only a few bytes over a small dict. An inline
+    # single-child slot pair (key, cell) in front of the dict was no better
+    # either: written out inline it only ties dict.get on a hit, wrapped in
+    # a helper it is twice as slow, and every other shape pays extra tests.
     value: Thing
     children: dict[str, 'Cell']
+    _is_ref: bool = field(default=False, repr=False, compare=False)
 
-    def __init__(self, value: Thing = None):
+    # Unset cells hold the Void singleton itself rather than None, so reads
+    # hand back cell.value with no "never set" check; every caller already
+    # passes the value explicitly, so construction does no branching either.
+    def __init__(self, value: Thing = Void):
         """
         Initialize a Cell with a value.
 
         Args:
-            value: Initial value (defaults to Void if None)
+            value: Initial value (defaults to Void)
         """
-        if value is None:
-            value = Void
         self.value = value
         self.children = {}
+        self._is_ref = type(value) is CellRef
+
+
+# Path caches on READ_STORE operands are valid for one Store (by serial) and
+# one graph epoch. The epoch moves whenever a Cell is replaced or deleted or
+# a CellRef is written, in any Store or Register: those are the only changes
+# that can make a path resolve to a different Cell, and a CellRef can route
+# a Store path through Register Cells. Creating Cells never invalidates a
+# path that already resolved, and misses are not cached.
+_graph_epoch = 0
+_store_serials = count()
+
+
+def _bump_graph_epoch():
+    """Invalidate every cached Store path."""
+    global _graph_epoch
+    _graph_epoch += 1
+
+
+def _undefined_store_path(components: Sequence[str]) -> 'RuntimeError':
+    """Build the error for reading a Store path that was never set."""
+    path_str = '.'.join(str(c) for c in components)
+    return RuntimeError(
+        f"Undefined Store path: '{path_str}'\n"
+        f"  Path was never set. Did you mean to:\n"
+        f"    - Initialize it first: () !{path_str}\n"
+        f"    - Set a nested value: <value> !{path_str}.<child>\n"
+        f"    - Check a different path?\n"
+        f"  Hint: Auto-vivified intermediate paths can be read after writing to children.\n"
+        f"        Example: 42 !a.b.c creates 'a' and 'a.b' with Void, which can be read."
+    )
+
+
+def _undefined_register_path(components: Sequence[str]) -> 'RuntimeError':
+    """Build the error for reading a Register path that was never set."""
+    # Format path nicely (skip the "_" root for display)
+    if len(components) > 1:
+        path_str = '.'.join(components[1:])
+    else:
+        path_str = ""
+
+    return RuntimeError(
+        f"Undefined Register path: '_.{path_str}'\n"
+        f"  Register paths must be written before reading.\n"
+        f"  Did you forget: <value> !_.{path_str}?"
+    )
 
 
 class Store:
@@ -260,6 +338,7 @@ class Store:
     def __init__(self):
         """Initialize Store with built-in operations."""
         self.root: dict[str, Cell] = {}
+        self._serial = next(_store_serials)
         self._populate_builtins()
 
     def _populate_builtins(self):
@@ -329,7 +408,7 @@ class Store:
         # Extension system
         self.root["use"] = Cell(value=BuiltinBlock("use", builtin_use))
 
-    def read_value(self, components: List[str]) -> Thing:
+    def read_value(self, components: Sequence[str]) -> Thing:
         """
         Read Cell value at path.
 
@@ -337,6 +416,10 @@ class Store:
         Auto-vivified intermediate cells (created during nested writes) can be read
         and return Void.
 
+        Compiled code does not come through here: READ_STORE caches the
+        resolved Cell on its operand (see _graph_epoch). This walk serves
+        Python callers such as builtins and extensions, and is not cached.
+
         Args:
             components: List of path components (e.g., ["a", "b", "c"])
 
@@ -348,19 +431,10 @@ class Store:
         """
         cell = self._get_cell(components)
         if cell is None:
-            path_str = '.'.join(str(c) for c in components)
-            raise RuntimeError(
-                f"Undefined Store path: '{path_str}'\n"
-                f"  Path was never set. Did you mean to:\n"
-                f"    - Initialize it first: () !{path_str}\n"
-                f"    - Set a nested value: <value> !{path_str}.<child>\n"
-                f"    - Check a different path?\n"
-                f"  Hint: Auto-vivified intermediate paths can be read after writing to children.\n"
-                f"        Example: 42 !a.b.c creates 'a' and 'a.b' with Void, which can be read."
-            )
+            raise _undefined_store_path(components)
         return cell.value
 
-    def read_ref(self, components: List[str]) -> CellRef:
+    def read_ref(self, components: Sequence[str]) -> CellRef:
         """
         Read CellRef at path.
 
@@ -375,7 +449,7 @@ class Store:
         cell = self._get_or_create_cell(components)
         return CellRef(cell)
 
-    def write_value(self, components: List[str], value: Thing):
+    def write_value(self, components: Sequence[str], value: Thing):
         """
         Write value to Cell at path.
 
@@ -394,14 +468,22 @@ class Store:
 
         # Check if current value is a CellRef - if so, write through
         # UNLESS we're writing a new CellRef (replacing the reference itself)
-        if isinstance(cell.value, CellRef) and not isinstance(value, CellRef):
+        is_ref = type(value) is CellRef
+        if cell._is_ref and not is_ref:
             # Write to the Cell that the CellRef points to
-            cell.value.cell.value = value
+            target = cell.value.cell
+            if target._is_ref:
+                _bump_graph_epoch()
+                target._is_ref = False
+            target.value = value
         else:
             # Normal write (or replacing a CellRef with a new CellRef)
+            if is_ref:
+                _bump_graph_epoch()
             cell.value = value
+            cell._is_ref = is_ref
 
-    def write_ref(self, components: List[str], value: Thing):
+    def write_ref(self, components: Sequence[str], value: Thing):
         """
         Replace entire Cell at path.
 
@@ -412,16 +494,18 @@ class Store:
             components: List of path components
             value: Value to write (Void triggers deletion)
         """
-        if isinstance(value, VoidSingleton):
+        _bump_graph_epoch()
+        if value is Void:
             # Structural deletion
             self._delete_cell(components)
         else:
             # Replace Cell
             cell = self._get_or_create_cell(components)
             cell.value = value
+            cell._is_ref = type(value) is CellRef
             cell.children.clear()  # Remove all children
 
-    def _get_cell(self, components: List[str]) -> Optional[Cell]:
+    def _get_cell(self, components: Sequence[str]) -> Optional[Cell]:
         """
         Get Cell at path without creating.
 
@@ -436,9 +520,9 @@ class Store:
 
         current = self.root
         for component in components[:-1]:
-            if component not in current:
+            cell = current.get(component)
+            if cell is None:
                 return None
-            cell = current[component]
 
             # CellRef dereferencing: If a Cell's value is a CellRef, we follow it.
             # This enables transparent reference semantics. For example:
@@ -446,7 +530,7 @@ class Store:
             #   data. !ref    - Store a CellRef to 'data' cell at 'ref'
             #   ref.x         - Should return 42 (follow ref -> data, then access x)
             # Without this check, we'd only look at ref's children, missing the indirection.
-            if isinstance(cell.value, CellRef):
+            if cell._is_ref:
                 cell = cell.value.cell
 
             current = cell.children
@@ -454,7 +538,7 @@ class Store:
         final_component = components[-1]
         return current.get(final_component)
 
-    def _get_or_create_cell(self, components: List[str]) -> Cell:
+    def _get_or_create_cell(self, components: Sequence[str]) -> Cell:
         """
         Get or create Cell at path (auto-vivification).
 
@@ -472,31 +556,36 @@ class Store:
 
         # Auto-vivify intermediate cells
         for component in components[:-1]:
-            if component not in current:
-                current[component] = Cell(value=Void)
-            cell = current[component]
+            cell = current.get(component)
+            if cell is None:
+                cell = current[component] = Cell(value=Void)
 
             # CellRef dereferencing: Follow references during path traversal.
             # This ensures writes through CellRefs work correctly. For example:
             #   data. !ref    - Store CellRef to 'data' at 'ref'
             #   99 !ref.y     - Should write to data.y (follow ref -> data, then write y)
             # Without this, we'd create a child 'y' under 'ref' instead of following the reference.
-            if isinstance(cell.value, CellRef):
+            if cell._is_ref:
                 cell = cell.value.cell
 
             current = cell.children
 
         # Get or create final cell
         final_component = components[-1]
-        if final_component not in current:
-            current[final_component] = Cell(value=Void)
+        cell = current.get(final_component)
+        if cell is None:
+            cell = current[final_component] = Cell(value=Void)
 
-        return current[final_component]
+        return cell
 
-    def _delete_cell(self, components: List[str]):
+    def _delete_cell(self, components: Sequence[str]):
         """
         Delete Cell at path (structural deletion).
 
+        The removed Cell is left to the garbage collector rather than
+        recycled through a free list: a CellRef taken earlier may still hold
+        it, and that CellRef must keep seeing the Cell's own value.
+
         Args:
             components: List of path components
         """
@@ -506,64 +595,34 @@ class Store:
         # Navigate to parent
         current = self.root
         for component in components[:-1]:
-            if component not in current:
+            cell = current.get(component)
+            if cell is None:
                 return  # Path doesn't exist, nothing to delete
-            current = current[component].children
+            current = cell.children
 
-        # Delete child
-        final_component = components[-1]
-        if final_component in current:
-            del current[final_component]
+        # Delete child (if present)
+        current.pop(components[-1], None)
 
 
 class Register:
     """
     Block-local hierarchical Cell graph.
 
-    Created fresh for each block execution.
+    Created fresh for each block execution (an emptied Register from the
+    VM's pool is as good as a new one).
     Destroyed when block completes.
     Completely isolated from parent block's Register.
 
     Has the same interface as Store (read_value, read_ref, write_value, write_ref).
+    Paths must start with "_"; compile_node rejects malformed Register
+    paths, so the methods here do not re-validate them.
     """
 
     def __init__(self):
         """Initialize empty Register."""
         self.root: dict[str, Cell] = {}
 
-    def _validate_register_path(self, components: List[str]):
-        """
-        Validate Register path syntax.
-
-        Rules:
-        - Must have at least one component
-        - First component must be exactly "_"
-        - Invalid: ["_root"], ["_temp"], ["_x"], etc. (malformed single-component paths)
-
-        Args:
-            components: Path components to validate
-
-        Raises:
-            RuntimeError: If path is invalid
-        """
-        if len(components) == 0:
-            raise RuntimeError("Empty Register path not allowed")
-
-        # First component must be exactly "_"
-        # This rejects ["_root"], ["_temp"], etc. which are malformed single-component paths
-        if components[0] != "_":
-            # Check if it looks like a malformed register path (starts with underscore)
-            if components[0].startswith("_"):
-                raise RuntimeError(
-                    f"Invalid Register path '{components[0]}': use '_' for root or "
-                    f"'_.{components[0][1:]}' for child"
-                )
-            else:
-                raise RuntimeError(
-                    f"Register paths must start with '_', got: {'.'.join(components)}"
-                )
-
-    def read_value(self, components: List[str]) -> Thing:
+    def read_value(self, components: Sequence[str]) -> Thing:
         """
         Read Cell value at path.
 
@@ -578,23 +637,12 @@ class Register:
         Raises:
             RuntimeError: If path doesn't exist
         """
-        self._validate_register_path(components)
         cell = self._get_cell(components)
         if cell is None:
-            # Format path nicely (skip the "_" root for display)
-            if len(components) > 1:
-                path_str = '.'.join(components[1:])
-            else:
-                path_str = ""
-
-            raise RuntimeError(
-                f"Undefined Register path: '_.{path_str}'\n"
-                f"  Register paths must be written before reading.\n"
-                f"  Did you forget: <value> !_.{path_str}?"
-            )
+            raise _undefined_register_path(components)
         return cell.value
 
-    def read_ref(self, components: List[str]) -> CellRef:
+    def read_ref(self, components: Sequence[str]) -> CellRef:
         """
         Read CellRef at path.
 
@@ -606,11 +654,10 @@ class Register:
         Returns:
             CellRef to the Cell at the path
         """
-        self._validate_register_path(components)
         cell = self._get_or_create_cell(components)
         return CellRef(cell)
 
-    def write_value(self, components: List[str], value: Thing):
+    def write_value(self, components: Sequence[str], value: Thing):
         """
         Write value to Cell at path.
 
@@ -624,21 +671,27 @@ class Register:
             components: List of path components
             value: Value to write (including Void)
         """
-        self._validate_register_path(components)
-
         # Auto-vivify intermediate cells and get target cell
         cell = self._get_or_create_cell(components)
 
         # Check if current value is a CellRef - if so, write through
         # UNLESS we're writing a new CellRef (replacing the reference itself)
-        if isinstance(cell.value, CellRef) and not isinstance(value, CellRef):
+        is_ref = type(value) is CellRef
+        if cell._is_ref and not is_ref:
             # Write to the Cell that the CellRef points to
-            cell.value.cell.value = value
+            target = cell.value.cell
+            if target._is_ref:
+                _bump_graph_epoch()
+                target._is_ref = False
+            target.value = value
         else:
             # Normal write (or replacing a CellRef with a new CellRef)
+            if is_ref:
+                _bump_graph_epoch()
             cell.value = value
+            cell._is_ref = is_ref
 
-    def write_ref(self, components: List[str], value: Thing):
+    def write_ref(self, components: Sequence[str], value: Thing):
         """
         Replace entire Cell at path.
 
@@ -649,59 +702,18 @@ class Register:
             components: List of path components
             value: Value to write (Void triggers deletion)
         """
-        self._validate_register_path(components)
-
-        if isinstance(value, VoidSingleton):
+        _bump_graph_epoch()
+        if value is Void:
             # Structural deletion
             self._delete_cell(components)
         else:
             # Replace Cell
             cell = self._get_or_create_cell(components)
             cell.value = value
+            cell._is_ref = type(value) is CellRef
             cell.children.clear()  # Remove all children
 
-    def _resolve_register_root(self, components: List[str], auto_vivify: bool = False) -> Optional[dict]:
-        """
-        Helper: Resolve the Register root and handle CellRef dereferencing.
-
-        This centralizes the logic for:
-        - Validating Register paths start with "_"
-        - Getting/creating the root Cell
-        - Following CellRef if root has been aliased (context-passing pattern)
-        - Returning the dict to start traversal from
-
-        Args:
-            components: Full path including "_" prefix
-            auto_vivify: If True, create root Cell if it doesn't exist
-
-        Returns:
-            Dictionary to start traversal from (root_cell.children after dereferencing)
-            or None if root doesn't exist (when auto_vivify=False)
-        """
-        if len(components) == 0:
-            raise RuntimeError("Empty path not allowed")
-
-        # Register paths must start with "_"
-        if components[0] != "_":
-            raise RuntimeError(f"Register paths must start with '_', got: {components}")
-
-        # Get or create root Cell
-        if "_" not in self.root:
-            if not auto_vivify:
-                return None
-            self.root["_"] = Cell(value=Void)
-
-        root_cell = self.root["_"]
-
-        # Context-passing: If root's value is a CellRef, follow it.
-        # This enables the idiom where outer Register is passed via `_.` and stored as `!_.`
-        # Then all subsequent accesses like `_.x` transparently access the aliased Register.
-        if isinstance(root_cell.value, CellRef):
-            root_cell = root_cell.value.cell
-
-        return root_cell.children
-
-    def _get_cell(self, components: List[str]) -> Optional[Cell]:
+    def _get_cell(self, components: Sequence[str]) -> Optional[Cell]:
         """
         Get Cell at path without creating.
 
@@ -709,32 +721,30 @@ class Register:
         All Register data lives as children of this root Cell.
         For example: ["_", "x"] means root["_"].children["x"]
         """
-        if len(components) == 0:
+        root_cell = self.root.get("_")
+        if root_cell is None:
             return None
 
-        # If just accessing "_" itself, need to follow CellRef if present
+        # Context-passing: If root's value is a CellRef, follow it.
+        # This enables the idiom where outer Register is passed via `_.` and stored as `!_.`
+        # Then all subsequent accesses like `_.x` transparently access the aliased Register.
+        if root_cell._is_ref:
+            root_cell = root_cell.value.cell
+
+        # Just accessing "_" itself
         if len(components) == 1:
-            root_cell = self.root.get("_")
-            if root_cell is None:
-                return None
-            # Follow CellRef if root has been aliased (context-passing)
-            if isinstance(root_cell.value, CellRef):
-                return root_cell.value.cell
             return root_cell
 
-        # Resolve root and get starting point for traversal
-        current = self._resolve_register_root(components, auto_vivify=False)
-        if current is None:
-            return None
+        current = root_cell.children
 
         # Traverse path (with CellRef dereferencing at each step)
         for component in components[1:-1]:
-            if component not in current:
+            cell = current.get(component)
+            if cell is None:
                 return None
-            cell = current[component]
 
             # CellRef dereferencing during path traversal
-            if isinstance(cell.value, CellRef):
+            if cell._is_ref:
                 cell = cell.value.cell
 
             current = cell.children
@@ -742,49 +752,48 @@ class Register:
         final_component = components[-1]
         return current.get(final_component)
 
-    def _get_or_create_cell(self, components: List[str]) -> Cell:
+    def _get_or_create_cell(self, components: Sequence[str]) -> Cell:
         """
         Get or create Cell at path (auto-vivification).
 
         Register paths should start with "_" which represents the Register root Cell.
         All Register data lives as children of this root Cell.
         """
-        if len(components) == 0:
-            raise RuntimeError("Cannot get cell with empty path")
+        root_cell = self.root.get("_")
+        if root_cell is None:
+            root_cell = self.root["_"] = Cell(value=Void)
+
+        # Follow CellRef if root has been aliased (context-passing)
+        if root_cell._is_ref:
+            root_cell = root_cell.value.cell
 
-        # If just accessing "_" itself, need to follow CellRef if present
+        # Just accessing "_" itself
         if len(components) == 1:
-            if "_" not in self.root:
-                self.root["_"] = Cell(value=Void)
-            root_cell = self.root["_"]
-            # Follow CellRef if root has been aliased (context-passing)
-            if isinstance(root_cell.value, CellRef):
-                return root_cell.value.cell
             return root_cell
 
-        # Resolve root and get starting point for traversal (creates root if needed)
-        current = self._resolve_register_root(components, auto_vivify=True)
+        current = root_cell.children
 
         # Auto-vivify and traverse path (with CellRef dereferencing)
         for component in components[1:-1]:
-            if component not in current:
-                current[component] = Cell(value=Void)
-            cell = current[component]
+            cell = current.get(component)
+            if cell is None:
+                cell = current[component] = Cell(value=Void)
 
             # CellRef dereferencing during path traversal
-            if isinstance(cell.value, CellRef):
+            if cell._is_ref:
                 cell = cell.value.cell
 
             current = cell.children
 
         # Get or create final cell
         final_component = components[-1]
-        if final_component not in current:
-            current[final_component] = Cell(value=Void)
+        cell = current.get(final_component)
+        if cell is None:
+            cell = current[final_component] = Cell(value=Void)
 
-        return current[final_component]
+        return cell
 
-    def _delete_cell(self, components: List[str]):
+    def _delete_cell(self, components: Sequence[str]):
         """Delete Cell at path (structural deletion)."""
         if len(components) == 0:
             return
@@ -792,47 +801,118 @@ class Register:
         # Navigate to parent
         current = self.root
         for component in components[:-1]:
-            if component not in current:
+            cell = current.get(component)
+            if cell is None:
                 return  # Path doesn't exist, nothing to delete
-            current = current[component].children
+            current = cell.children
 
-        # Delete child
-        final_component = components[-1]
-        if final_component in current:
-            del current[final_component]
+        # Delete child (if present)
+        current.pop(components[-1], None)
 
 
 # ==================== RunNode and Compilation ====================
 
 
-@dataclass
+class Op:
+    """
+    Opcodes of compiled code.
+
+    Compiling an AST node yields a short sequence of opcodes, each paired
+    with one operand. Blocks and programs concatenate their statements'
+    sequences into two parallel lists (ops, args) and run them in a single
+    dispatch loop, _execute_ops, instead of making a Python call per
+    statement. The values follow how often each op runs in typical SOMA
+    code, which is also the order the loop tests them in.
+
+    ops and args stay lists: a list is already one contiguous array of
+    pointers, and zipping two tuples or a bytes opcode stream instead
+    measured no faster. A while loop indexing bytes by pc was ~2x slower.
+    """
+    EXEC_STORE1 = 0         # execute the value of the one-component Store path operand
+    READ_STORE = 1          # push the Store value at operand [components, serial, epoch, cell]
+    EXEC = 2                # pop the top of the AL and execute it (no operand)
+    READ_REGISTER1 = 3      # push the value of _.<operand>
+    PUSH = 4                # push operand (an int, string or Block)
+    STORE_REGISTER1 = 5     # pop and write the value of _.<operand>
+    STORE_STORE1 = 6        # pop and write the value of the Store path <operand>
+    STORE_STORE = 7         # pop and write the value of the Store path in operand
+    READ_REGISTER = 8       # push the Register value at operand (path components)
+    REF_STORE = 9           # push a CellRef to the Store path in operand
+    REF_REGISTER = 10       # push a CellRef to the Register path in operand
+    STORE_REGISTER = 11     # pop and write the value of the Register path in operand
+    STORE_REF_STORE = 12    # pop and replace the Cell at the Store path in operand
+    STORE_REF_REGISTER = 13 # pop and replace the Cell at the Register path in operand
+    PUSH_FOLDED = 14        # push a folded constant; operand is (value, guards, ops, args)
+    CALL = 15               # call operand(vm)
+
+
+# Opcodes bound once at module level for the dispatch loop.
+_OP_EXEC_STORE1, _OP_READ_STORE, _OP_EXEC, _OP_READ_REGISTER1 = (
+    Op.EXEC_STORE1, Op.READ_STORE, Op.EXEC, Op.READ_REGISTER1,
+)
+_OP_PUSH, _OP_STORE_REGISTER1, _OP_STORE_STORE1 = (
+    Op.PUSH, Op.STORE_REGISTER1, Op.STORE_STORE1,
+)
+_OP_STORE_STORE, _OP_READ_REGISTER, _OP_REF_STORE, _OP_REF_REGISTER = (
+    Op.STORE_STORE, Op.READ_REGISTER, Op.REF_STORE, Op.REF_REGISTER,
+)
+_OP_STORE_REGISTER, _OP_STORE_REF_STORE, _OP_STORE_REF_REGISTER = (
+    Op.STORE_REGISTER, Op.STORE_REF_STORE, Op.STORE_REF_REGISTER,
+)
+_OP_PUSH_FOLDED, _OP_CALL = Op.PUSH_FOLDED, Op.CALL
+
+
 class RunNode:
     """
-    Executable wrapper around AST node.
+    Compiled form of an AST node.
 
-    Combines AST node (for error reporting/debugging) with a compiled
-    execution function (for fast dispatch-free execution).
+    Combines the AST node (for error reporting/debugging) with the opcodes
+    it compiled to. A RunNode can also wrap a plain Python function taking
+    the VM, which runs as a single CALL op.
 
     Attributes:
         ast_node: Original AST node
-        execute: Execution function that takes VM and performs the operation
+        ops: Opcodes for the node (see Op)
+        args: Operand for each opcode in ops
     """
-    ast_node: Any  # AST node type
-    execute: Callable[['VM'], None]
+
+    __slots__ = ("ast_node", "ops", "args")
+
+    def __init__(self, ast_node: Any, execute: Optional[Callable[['VM'], None]] = None,
+                 ops: Optional[List[int]] = None, args: Optional[List[Any]] = None):
+        if ops is None:
+            ops = [_OP_CALL]
+            args = [execute]
+        self.ast_node = ast_node
+        self.ops = ops
+        self.args = args
+
+    def execute(self, vm: 'VM'):
+        """Execute this node's opcodes on the VM."""
+        _execute_ops(vm, self.ops, self.args)
 
     def __repr__(self):
-        return f"RunNode({self.ast_node.__class__.__name__})"
+        node = self.ast_node
+        kind = node["kind"] if isinstance(node, dict) else node.__class__.__name__
+        return f"RunNode({kind})"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledProgram:
     """
     Compiled SOMA program ready for execution.
 
     Attributes:
         run_nodes: List of compiled RunNodes for top-level statements
+        ops: The statements' opcodes, concatenated (see Op)
+        args: Operand for each opcode in ops
     """
     run_nodes: List[RunNode]
+    ops: List[int] = field(init=False, repr=False, compare=False)
+    args: List[Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.ops, self.args = _link(self.run_nodes)
 
     def execute(self, vm: 'VM'):
         """
@@ -841,8 +921,453 @@ class CompiledProgram:
         Args:
             vm: VM instance to execute in
         """
-        for rn in self.run_nodes:
-            rn.execute(vm)
+        _execute_ops(vm, self.ops, self.args)
+
+
+def _link(run_nodes: List[RunNode]):
+    """
+    Concatenate the opcodes and operands of a statement sequence.
+
+    Pure builtins applied to literals are folded on the way: as many
+    constant pushes as a builtin in _FOLDABLE_BUILTINS takes, followed by
+    >name, become a single PUSH_FOLDED. A folded constant counts as a
+    literal itself, so chains such as "1 2 >+ 3 >* >toString" fold
+    completely, and a Block whose body is only such code runs as pushes.
+    """
+    ops = []
+    args = []
+    for rn in run_nodes:
+        for op, arg in zip(rn.ops, rn.args):
+            if op == _OP_EXEC_STORE1 and arg in _FOLDABLE_BUILTINS:
+                arity = _FOLDABLE_BUILTINS[arg][1]
+                if len(ops) >= arity:
+                    folded = _fold_constant(ops[-arity:], args[-arity:], arg)
+                    if folded is not None:
+                        del ops[-arity:]
+                        del args[-arity:]
+                        ops.append(_OP_PUSH_FOLDED)
+                        args.append(folded)
+                        continue
+            ops.append(op)
+            args.append(arg)
+    return ops, args
+
+
+def _fold_constant(operand_ops: List[int], operand_args: List[Any], name: str) -> Optional[tuple]:
+    """
+    Build the PUSH_FOLDED operand for "<operands> >name", or None if it can't fold.
+
+    The operands must be literal (or folded) values of one of the builtin's
+    operand types, all the same type. Results the builtin would raise on,
+    such as division by zero, are left to raise at run time.
+
+    The operand is (value, guards, ops, args). guards pairs each builtin
+    name the value depends on with the builtin's function: the value is
+    only valid while the Store still binds those names to those builtins,
+    and otherwise the original ops/args run instead.
+    """
+    fn, _, types, compute = _FOLDABLE_BUILTINS[name]
+    operands = []
+    guards = {}
+    orig_ops = []
+    orig_args = []
+    for op, arg in zip(operand_ops, operand_args):
+        if op == _OP_PUSH:
+            operands.append(arg)
+            orig_ops.append(op)
+            orig_args.append(arg)
+        elif op == _OP_PUSH_FOLDED:
+            value, inner_guards, inner_ops, inner_args = arg
+            operands.append(value)
+            guards.update(inner_guards)
+            orig_ops.extend(inner_ops)
+            orig_args.extend(inner_args)
+        else:
+            return None
+
+    operand_type = type(operands[0])
+    if operand_type not in types or any(type(v) is not operand_type for v in operands):
+        return None
+    try:
+        value = compute(*operands)
+    except (ZeroDivisionError, ValueError):
+        return None
+
+    guards[name] = fn
+    orig_ops.append(_OP_EXEC_STORE1)
+    orig_args.append(name)
+    return (value, tuple(guards.items()), orig_ops, orig_args)
+
+
+def _not_executable(thing: Thing) -> 'RuntimeError':
+    """Build the error for executing a value that is not a Block."""
+    if isinstance(thing, (VoidSingleton, NilSingleton)):
+        # Void/Nil on AL treated as underflow (nothing to execute)
+        return RuntimeError(
+            f"AL underflow: exec requires executable Block on AL, got {type(thing).__name__}"
+        )
+    return RuntimeError(
+        f"Cannot execute {type(thing).__name__}: only Blocks are executable"
+    )
+
+
+def _store_underflow() -> 'RuntimeError':
+    """Build the error for a store with nothing on the AL."""
+    return RuntimeError("AL underflow: store requires value on AL")
+
+
+# A Block run _FAST_EXECUTE_THRESHOLD times has its body turned into one
+# straight-line Python function, which then runs in place of the dispatch
+# loop. Set SOMA_FAST_EXECUTE_THRESHOLD=0 in the environment to disable it.
+_FAST_EXECUTE_THRESHOLD = int(os.environ.get("SOMA_FAST_EXECUTE_THRESHOLD", "50"))
+
+# Source for each opcode, with {a} standing for its operand. Each is the
+# matching branch of _execute_ops, restructured to run without continue.
+_FAST_EXECUTE_SOURCE = {
+    _OP_EXEC_STORE1: """\
+cell = store.root.get({a})
+if cell is None:
+    raise _undefined_store_path(({a},))
+thing = cell.value
+if type(thing) is BuiltinBlock:
+    thing.fn(vm)
+elif type(thing) is Block:
+    _execute_ops(vm, thing.ops, thing.args, thing)
+else:
+    raise _not_executable(thing)
+""",
+    _OP_READ_STORE: """\
+if {a}[2] == _graph_epoch and {a}[1] == serial:
+    push({a}[3].value)
+else:
+    cell = store._get_cell({a}[0])
+    if cell is None:
+        raise _undefined_store_path({a}[0])
+    {a}[1] = serial
+    {a}[2] = _graph_epoch
+    {a}[3] = cell
+    push(cell.value)
+""",
+    _OP_EXEC: """\
+thing = pop()
+if type(thing) is Block:
+    _execute_ops(vm, thing.ops, thing.args, thing)
+elif type(thing) is BuiltinBlock:
+    thing.fn(vm)
+else:
+    raise _not_executable(thing)
+""",
+    _OP_READ_REGISTER1: """\
+root = register.root.get("_")
+cell = None
+if root is not None:
+    if root._is_ref:
+        root = root.value.cell
+    cell = root.children.get({a})
+if cell is None:
+    raise _undefined_register_path(("_", {a}))
+push(cell.value)
+""",
+    _OP_PUSH: """\
+push({a})
+""",
+    _OP_STORE_REGISTER1: """\
+if not al:
+    raise _store_underflow()
+value = pop()
+root = register.root.get("_")
+cell = None
+if root is not None:
+    if root._is_ref:
+        root = root.value.cell
+    cell = root.children.get({a})
+if cell is not None and not cell._is_ref and type(value) is not CellRef:
+    cell.value = value
+else:
+    register.write_value(("_", {a}), value)
+""",
+    _OP_STORE_STORE1: """\
+if not al:
+    raise _store_underflow()
+value = pop()
+cell = store.root.get({a})
+if cell is not None and not cell._is_ref and type(value) is not CellRef:
+    cell.value = value
+else:
+    store.write_value(({a},), value)
+""",
+    _OP_STORE_STORE: """\
+if not al:
+    raise _store_underflow()
+store.write_value({a}, pop())
+""",
+    _OP_READ_REGISTER: """\
+cell = register._get_cell({a})
+if cell is None:
+    raise _undefined_register_path({a})
+push(cell.value)
+""",
+    _OP_REF_STORE: """\
+push(store.read_ref({a}))
+""",
+    _OP_REF_REGISTER: """\
+push(register.read_ref({a}))
+""",
+    _OP_STORE_REGISTER: """\
+if not al:
+    raise _store_underflow()
+register.write_value({a}, pop())
+""",
+    _OP_STORE_REF_STORE: """\
+if not al:
+    raise _store_underflow()
+store.write_ref({a}, pop())
+""",
+    _OP_STORE_REF_REGISTER: """\
+if not al:
+    raise _store_underflow()
+register.write_ref({a}, pop())
+""",
+    _OP_PUSH_FOLDED: """\
+for name, fn in {a}[1]:
+    cell = store.root.get(name)
+    if (cell is None or type(cell.value) is not BuiltinBlock
+            or cell.value.fn is not fn):
+        _execute_ops(vm, {a}[2], {a}[3])
+        break
+else:
+    push({a}[0])
+""",
+    _OP_CALL: """\
+{a}(vm)
+""",
+}
+
+# >+, >-, >* and >< on two exact ints are done in place while the name is
+# still bound to the builtin; anything else takes the EXEC_STORE1 path.
+_FAST_EXECUTE_INT_OPS = {
+    "+": "a + b",
+    "-": "a - b",
+    "*": "a * b",
+    "<": "True_ if a < b else False_",
+}
+
+_FAST_EXECUTE_INT_SOURCE = """\
+cell = store.root.get({a})
+if (cell is not None and type(cell.value) is BuiltinBlock and cell.value.fn is {fn}
+        and len(al) >= 2 and type(al[-1]) is int and type(al[-2]) is int):
+    b = pop()
+    a = al[-1]
+    al[-1] = {expr}
+else:
+"""
+
+
+def _generate_fast_execute(ops: List[int], args: List[Any]) -> Callable:
+    """
+    Generate a straight-line Python function for a Block body.
+
+    Each op's code is its branch of _execute_ops with the operand bound as
+    a closure variable, so running the function does what the dispatch loop
+    would without testing the opcode of every op.
+    """
+    lines = ["def _make(args):"]
+    lines.extend(f"    a{i} = args[{i}]" for i in range(len(args)))
+    lines.append("    def fast_execute(vm, al, push, pop, store, serial, register):")
+    lines.append("        pass")
+    for i, (op, arg) in enumerate(zip(ops, args)):
+        source = _FAST_EXECUTE_SOURCE[op].format(a=f"a{i}")
+        indent = " " * 8
+        if op == _OP_EXEC_STORE1 and arg in _FAST_EXECUTE_INT_OPS:
+            fn = _FOLDABLE_BUILTINS[arg][0]
+            lines.extend(indent + line for line in _FAST_EXECUTE_INT_SOURCE.format(
+                a=f"a{i}", fn=fn.__name__, expr=_FAST_EXECUTE_INT_OPS[arg]).splitlines())
+            indent += "    "
+        lines.extend(indent + line for line in source.splitlines())
+    lines.append("    return fast_execute")
+
+    namespace = {}
+    exec(compile("\n".join(lines), "<soma fast_execute>", "exec"), globals(), namespace)
+    return namespace["_make"](args)
+
+
+def _execute_ops(vm: 'VM', ops: List[int], args: List[Any], block: Optional[Block] = None):
+    """
+    Run a compiled opcode sequence on the VM.
+
+    With a block, the sequence is that block's body: it runs with a fresh
+    Register and the block as current_block, both restored on exit. Block
+    calls from the loop come straight back here, so each one costs a single
+    Python frame.
+
+    The AL, Store and Register are read into locals once. Executing a Block
+    swaps vm.register and restores it before returning, so the local copy
+    stays valid across EXEC.
+    """
+    if block is not None:
+        # Save current register and block context
+        saved_register = vm.register
+        saved_block = vm.current_block
+
+        # Fresh (empty) Register for this block, reused from the VM's pool
+        pool = vm._register_pool
+        vm.register = pool.pop() if pool else Register()
+        vm.current_block = block
+
+        fast_execute = block.fast_execute
+        if fast_execute is None:
+            block.runs += 1
+            if block.runs == _FAST_EXECUTE_THRESHOLD:
+                fast_execute = block.fast_execute = _generate_fast_execute(ops, args)
+    else:
+        fast_execute = None
+
+    al = vm.al
+    push = al.append
+    pop = al.pop
+    store = vm.store
+    serial = store._serial
+    register = vm.register
+
+    # Dispatch is an if/elif chain ordered by op frequency. A table of one
+    # handler function per opcode was tried and ran straight-line code about
+    # 60% slower: each op then pays for a Python call, which costs far more
+    # than the few integer compares it replaces.
+    try:
+        if fast_execute is not None:
+            fast_execute(vm, al, push, pop, store, serial, register)
+            return
+        for op, arg in zip(ops, args):
+            if op == _OP_EXEC_STORE1:
+                # >name: the Store root is looked up here and its value run
+                # without a round trip through the AL; builtins are called
+                # straight through fn.
+                cell = store.root.get(arg)
+                if cell is None:
+                    raise _undefined_store_path((arg,))
+                thing = cell.value
+                if type(thing) is BuiltinBlock:
+                    thing.fn(vm)
+                elif type(thing) is Block:
+                    _execute_ops(vm, thing.ops, thing.args, thing)
+                else:
+                    raise _not_executable(thing)
+            elif op == _OP_READ_STORE:
+                # Inline cache: reuse the Cell this path last resolved to
+                # while the Store and the graph epoch are unchanged (see
+                # _graph_epoch); only a miss pays for building the error.
+                if arg[2] == _graph_epoch and arg[1] == serial:
+                    push(arg[3].value)
+                    continue
+                cell = store._get_cell(arg[0])
+                if cell is None:
+                    raise _undefined_store_path(arg[0])
+                arg[1] = serial
+                arg[2] = _graph_epoch
+                arg[3] = cell
+                push(cell.value)
+            elif op == _OP_EXEC:
+                # The target's own op always runs first, so the AL is not empty
+                thing = pop()
+                if type(thing) is Block:
+                    _execute_ops(vm, thing.ops, thing.args, thing)
+                elif type(thing) is BuiltinBlock:
+                    thing.fn(vm)
+                else:
+                    raise _not_executable(thing)
+            elif op == _OP_READ_REGISTER1:
+                # _.name: the root Cell, through its CellRef if the Register was
+                # passed in with !_, then one child.
+                root = register.root.get("_")
+                if root is not None:
+                    if root._is_ref:
+                        root = root.value.cell
+                    cell = root.children.get(arg)
+                    if cell is not None:
+                        push(cell.value)
+                        continue
+                raise _undefined_register_path(("_", arg))
+            elif op == _OP_PUSH:
+                push(arg)
+            elif op == _OP_STORE_REGISTER1:
+                if not al:
+                    raise _store_underflow()
+                value = pop()
+
+                # Plain overwrite of an existing _.name; auto-vivifying and
+                # writing a CellRef or through one are left to write_value.
+                root = register.root.get("_")
+                if root is not None:
+                    if root._is_ref:
+                        root = root.value.cell
+                    cell = root.children.get(arg)
+                    if (cell is not None and not cell._is_ref
+                            and type(value) is not CellRef):
+                        cell.value = value
+                        continue
+                register.write_value(("_", arg), value)
+            elif op == _OP_STORE_STORE1:
+                if not al:
+                    raise _store_underflow()
+                value = pop()
+
+                # !name: plain overwrite of an existing top-level Store Cell,
+                # as STORE_REGISTER1 does for _.name
+                cell = store.root.get(arg)
+                if (cell is not None and not cell._is_ref
+                        and type(value) is not CellRef):
+                    cell.value = value
+                    continue
+                store.write_value((arg,), value)
+            elif op == _OP_STORE_STORE:
+                if not al:
+                    raise _store_underflow()
+                store.write_value(arg, pop())
+            elif op == _OP_READ_REGISTER:
+                cell = register._get_cell(arg)
+                if cell is None:
+                    raise _undefined_register_path(arg)
+                push(cell.value)
+            elif op == _OP_REF_STORE:
+                push(store.read_ref(arg))
+            elif op == _OP_REF_REGISTER:
+                push(register.read_ref(arg))
+            elif op == _OP_STORE_REGISTER:
+                if not al:
+                    raise _store_underflow()
+                register.write_value(arg, pop())
+            elif op == _OP_STORE_REF_STORE:
+                # Reference write - replace entire cell
+                if not al:
+                    raise _store_underflow()
+                store.write_ref(arg, pop())
+            elif op == _OP_STORE_REF_REGISTER:
+                if not al:
+                    raise _store_underflow()
+                register.write_ref(arg, pop())
+            elif op == _OP_PUSH_FOLDED:
+                # The folded value stands while every builtin it was folded
+                # through is still bound; otherwise run the original ops
+                value, guards, orig_ops, orig_args = arg
+                for name, fn in guards:
+                    cell = store.root.get(name)
+                    if (cell is None or type(cell.value) is not BuiltinBlock
+                            or cell.value.fn is not fn):
+                        _execute_ops(vm, orig_ops, orig_args)
+                        break
+                else:
+                    push(value)
+            else:
+                arg(vm)
+    finally:
+        if block is not None:
+            # Restore register (block-local state destroyed). Clearing the
+            # root only drops the Register's own hold on its Cells; any
+            # CellRef that escaped the block keeps its Cell alive.
+            vm.register = saved_register
+            vm.current_block = saved_block
+            register.root.clear()
+            pool.append(register)
 
 
 def compile_program(program: Union[Program, dict]) -> CompiledProgram:
@@ -864,13 +1389,8 @@ def compile_program(program: Union[Program, dict]) -> CompiledProgram:
     """
     # Handle dict input from parse()
     if isinstance(program, dict):
-        from soma.parser import Parser
-        from soma.lexer import lex
-
-        # If it's already a dict, we need to reconstruct the Program
-        # Actually, we need to work with the dict structure
-        statements = [_dict_to_ast(stmt) for stmt in program["body"]]
-        run_nodes = [compile_node(stmt) for stmt in statements]
+        # Compiled straight from the dicts, without rebuilding AST objects
+        run_nodes = [_compile_dict(stmt) for stmt in program["body"]]
     else:
         # It's a Program object
         run_nodes = [compile_node(stmt) for stmt in program.statements]
@@ -878,177 +1398,236 @@ def compile_program(program: Union[Program, dict]) -> CompiledProgram:
     return CompiledProgram(run_nodes)
 
 
-def _dict_to_ast(node_dict: dict) -> Any:
-    """Convert dictionary AST representation back to AST node objects."""
-    kind = node_dict["kind"]
+def compile_source(source: str) -> CompiledProgram:
+    """
+    Lex, parse and compile SOMA source code.
 
-    if kind == "IntNode":
-        return IntNode(value=node_dict["value"])
-    elif kind == "StringNode":
-        return StringNode(value=node_dict["value"])
-    elif kind == "BlockNode":
-        body = [_dict_to_ast(n) for n in node_dict["body"]]
-        return BlockNode(body=body)
-    elif kind == "ValuePath":
-        return ValuePath(components=node_dict["components"])
-    elif kind == "ReferencePath":
-        return ReferencePath(components=node_dict["components"])
-    elif kind == "ExecNode":
-        target = _dict_to_ast(node_dict["target"])
-        return ExecNode(target=target)
-    elif kind == "StoreNode":
-        target = _dict_to_ast(node_dict["target"])
-        return StoreNode(target=target)
-    else:
-        raise CompileError(f"Unknown AST node kind: {kind}")
+    Args:
+        source: SOMA source code string
+
+    Returns:
+        CompiledProgram ready for execution
+    """
+    return compile_program(Parser(lex(source, cache=False)).parse())
+
+
+# Path op for each storage (is_register) and, for stores, write kind (is_ref)
+_REF_OPS = {False: _OP_REF_STORE, True: _OP_REF_REGISTER}
+_STORE_OPS = {
+    (False, False): _OP_STORE_STORE,
+    (False, True): _OP_STORE_REF_STORE,
+    (True, False): _OP_STORE_REGISTER,
+    (True, True): _OP_STORE_REF_REGISTER,
+}
+
+# One tuple per distinct path compiled (see _compile_path)
+_interned_paths: dict[tuple, tuple] = {}
+
+
+def _compile_path(components: Sequence[str]) -> tuple:
+    """
+    Freeze path components into the tuple operand of a path op.
+
+    Components are interned so the dict lookups of every path walk can
+    match keys by identity; the walks only iterate and slice, which tuples
+    support as well as lists. The tuple itself is interned too, so every
+    occurrence of a path in compiled code shares one operand object.
+
+    Register paths are validated here, once, rather than on every access:
+    a path rooted at "_" is well formed by construction, and a lone
+    component that merely starts with "_" (such as "_x") is rejected, as the
+    parser does. Longer paths such as "_x.y" are ordinary Store paths.
+
+    Raises:
+        CompileError: If the path is empty or a malformed Register path
+    """
+    if len(components) == 0:
+        raise CompileError("Empty path not allowed")
+
+    root = components[0]
+    if len(components) == 1 and root != "_" and root[:1] == "_":
+        raise CompileError(
+            f"Invalid Register path '{root}': use '_' for root or "
+            f"'_.{root[1:]}' for child"
+        )
+    path = tuple([intern(c) for c in components])
+    return _interned_paths.setdefault(path, path)
+
+
+def _compile_value_path(node: Any, components: Sequence[str]) -> RunNode:
+    """Compile a value path read."""
+    # Register paths keep their "_" root: the Register class handles
+    # "_" as the root Cell
+    components = _compile_path(components)
+    if components[0] != "_":
+        # Operand doubles as the path cache, filled on first execution
+        return RunNode(ast_node=node, ops=[_OP_READ_STORE], args=[[components, -1, -1, None]])
+    if len(components) == 2:
+        # _.name: the commonest Register read gets its own op
+        return RunNode(ast_node=node, ops=[_OP_READ_REGISTER1], args=[components[1]])
+    return RunNode(ast_node=node, ops=[_OP_READ_REGISTER], args=[components])
+
+
+def _compile_reference_path(node: Any, components: Sequence[str]) -> RunNode:
+    """Compile a reference path read."""
+    components = _compile_path(components)
+    op = _REF_OPS[components[0] == "_"]
+    return RunNode(ast_node=node, ops=[op], args=[components])
+
+
+def _compile_exec(node: Any, target_node: RunNode) -> RunNode:
+    """Compile an execute operation from its compiled target."""
+    ops = target_node.ops
+    args = target_node.args
+    if ops == [_OP_READ_STORE] and len(args[0][0]) == 1:
+        # >name on a top-level Store path (builtins, most user blocks)
+        return RunNode(ast_node=node, ops=[_OP_EXEC_STORE1], args=[args[0][0][0]])
+
+    # Otherwise push the target, then pop and execute it
+    return RunNode(ast_node=node, ops=ops + [_OP_EXEC], args=args + [None])
+
+
+def _compile_store(node: Any, components: Sequence[str], is_ref: bool) -> RunNode:
+    """Compile a store operation to a value or reference path."""
+    components = _compile_path(components)
+    is_register = (components[0] == "_")
+    if is_register and not is_ref and len(components) == 2:
+        # !_.name: the commonest Register write gets its own op
+        return RunNode(ast_node=node, ops=[_OP_STORE_REGISTER1], args=[components[1]])
+    if not is_register and not is_ref and len(components) == 1:
+        # !name: likewise for top-level Store writes
+        return RunNode(ast_node=node, ops=[_OP_STORE_STORE1], args=[components[0]])
+    # Storage and write kind are fixed here, so each store op does one thing
+    op = _STORE_OPS[is_register, is_ref]
+    return RunNode(ast_node=node, ops=[op], args=[components])
+
+
+def _compile_literal_node(node: Any) -> RunNode:
+    """Compile a literal: push its value onto the AL."""
+    return RunNode(ast_node=node, ops=[_OP_PUSH], args=[node.value])
+
+
+def _compile_block_node(node: BlockNode) -> RunNode:
+    """Compile a block: compile its body, then push the Block onto the AL."""
+    block = Block([compile_node(n) for n in node.body])
+    return RunNode(ast_node=node, ops=[_OP_PUSH], args=[block])
+
+
+def _compile_value_path_node(node: ValuePath) -> RunNode:
+    return _compile_value_path(node, node.components)
+
+
+def _compile_reference_path_node(node: ReferencePath) -> RunNode:
+    return _compile_reference_path(node, node.components)
+
+
+def _compile_exec_node(node: ExecNode) -> RunNode:
+    return _compile_exec(node, compile_node(node.target))
+
+
+def _compile_store_node(node: StoreNode) -> RunNode:
+    target = node.target
+    return _compile_store(node, target.components, type(target) is ReferencePath)
+
+
+# Exact AST class -> compiler; the parser never subclasses its node types
+_NODE_COMPILERS = {
+    IntNode: _compile_literal_node,
+    StringNode: _compile_literal_node,
+    BlockNode: _compile_block_node,
+    ValuePath: _compile_value_path_node,
+    ReferencePath: _compile_reference_path_node,
+    ExecNode: _compile_exec_node,
+    StoreNode: _compile_store_node,
+}
 
 
 def compile_node(node: Any) -> RunNode:
     """
     Compile AST node to RunNode.
 
-    This is where isinstance dispatch happens (once, at compile time).
-    Returns a RunNode with an execute function that operates on the VM.
+    This is where type dispatch happens (once, at compile time), through
+    one lookup of the node's class in _NODE_COMPILERS. Returns a RunNode
+    holding the opcodes that perform the node's operation on the VM.
 
     Args:
         node: AST node to compile
 
     Returns:
-        RunNode with execution function
+        RunNode with the node's opcodes
 
     Raises:
         CompileError: If node type is unknown
     """
-    if isinstance(node, IntNode):
-        # Compile integer literal - push value onto AL
-        value = node.value
-        return RunNode(
-            ast_node=node,
-            execute=lambda vm: vm.al.append(value)
-        )
+    compiler = _NODE_COMPILERS.get(type(node))
+    if compiler is None:
+        raise CompileError(f"Unknown AST node type: {type(node).__name__}")
+    return compiler(node)
 
-    elif isinstance(node, StringNode):
-        # Compile string literal - push value onto AL
-        value = node.value
-        return RunNode(
-            ast_node=node,
-            execute=lambda vm: vm.al.append(value)
-        )
 
-    elif isinstance(node, BlockNode):
-        # Compile block - recursively compile body, then push Block onto AL
-        body = [compile_node(n) for n in node.body]
-        block = Block(body)
-        return RunNode(
-            ast_node=node,
-            execute=lambda vm: vm.al.append(block)
-        )
+def _compile_literal_dict(node_dict: dict) -> RunNode:
+    return RunNode(ast_node=node_dict, ops=[_OP_PUSH], args=[node_dict["value"]])
 
-    elif isinstance(node, ValuePath):
-        # Compile value path read
-        components = node.components
-        is_register = (components[0] == "_")
-
-        if is_register:
-            # Register path: pass full path including "_"
-            # The Register class handles "_" as the root Cell
-            def read_register_value(vm):
-                vm.al.append(vm.register.read_value(components))
-
-            return RunNode(
-                ast_node=node,
-                execute=read_register_value
-            )
-        else:
-            # Store path
-            return RunNode(
-                ast_node=node,
-                execute=lambda vm: vm.al.append(vm.store.read_value(components))
-            )
-
-    elif isinstance(node, ReferencePath):
-        # Compile reference path read
-        components = node.components
-        is_register = (components[0] == "_")
-
-        if is_register:
-            # Register path: pass full path including "_"
-            # The Register class handles "_" as the root Cell
-            def read_register_ref(vm):
-                vm.al.append(vm.register.read_ref(components))
-
-            return RunNode(
-                ast_node=node,
-                execute=read_register_ref
-            )
-        else:
-            # Store path
-            return RunNode(
-                ast_node=node,
-                execute=lambda vm: vm.al.append(vm.store.read_ref(components))
-            )
-
-    elif isinstance(node, ExecNode):
-        # Compile execute operation
-        target_node = compile_node(node.target)
-
-        def exec_fn(vm: VM):
-            # Execute target to get value on AL
-            target_node.execute(vm)
-
-            # Pop and execute
-            if len(vm.al) == 0:
-                raise RuntimeError(f"AL underflow: exec requires value on AL")
-
-            thing = vm.al.pop()
-
-            # Execute the thing (must be a Block or BuiltinBlock)
-            if isinstance(thing, (Block, BuiltinBlock)):
-                thing.execute(vm)
-            elif isinstance(thing, (VoidSingleton, NilSingleton)):
-                # Void/Nil on AL treated as underflow (nothing to execute)
-                raise RuntimeError(
-                    f"AL underflow: exec requires executable Block on AL, got {type(thing).__name__}"
-                )
-            else:
-                raise RuntimeError(
-                    f"Cannot execute {type(thing).__name__}: only Blocks are executable"
-                )
 
-        return RunNode(ast_node=node, execute=exec_fn)
+def _compile_block_dict(node_dict: dict) -> RunNode:
+    block = Block([_compile_dict(n) for n in node_dict["body"]])
+    return RunNode(ast_node=node_dict, ops=[_OP_PUSH], args=[block])
 
-    elif isinstance(node, StoreNode):
-        # Compile store operation
-        target = node.target
-        is_ref = isinstance(target, ReferencePath)
-        components = target.components
-        is_register = (components[0] == "_")
 
-        def store_fn(vm: VM):
-            if len(vm.al) == 0:
-                raise RuntimeError(f"AL underflow: store requires value on AL")
+def _compile_value_path_dict(node_dict: dict) -> RunNode:
+    return _compile_value_path(node_dict, node_dict["components"])
 
-            value = vm.al.pop()
 
-            # Write to Store or Register
-            storage = vm.register if is_register else vm.store
+def _compile_reference_path_dict(node_dict: dict) -> RunNode:
+    return _compile_reference_path(node_dict, node_dict["components"])
 
-            if is_ref:
-                # Reference write - replace entire cell
-                storage.write_ref(components, value)
-            else:
-                # Value write
-                storage.write_value(components, value)
 
-        return RunNode(ast_node=node, execute=store_fn)
+def _compile_exec_dict(node_dict: dict) -> RunNode:
+    return _compile_exec(node_dict, _compile_dict(node_dict["target"]))
 
-    else:
-        raise CompileError(f"Unknown AST node type: {type(node).__name__}")
+
+def _compile_store_dict(node_dict: dict) -> RunNode:
+    target = node_dict["target"]
+    return _compile_store(node_dict, target["components"], target["kind"] == "ReferencePath")
+
+
+# AST dict "kind" -> compiler, mirroring _NODE_COMPILERS
+_DICT_COMPILERS = {
+    "IntNode": _compile_literal_dict,
+    "StringNode": _compile_literal_dict,
+    "BlockNode": _compile_block_dict,
+    "ValuePath": _compile_value_path_dict,
+    "ReferencePath": _compile_reference_path_dict,
+    "ExecNode": _compile_exec_dict,
+    "StoreNode": _compile_store_dict,
+}
+
+
+def _compile_dict(node_dict: dict) -> RunNode:
+    """
+    Compile the dictionary form of an AST node (as returned by parse()).
+
+    Mirrors compile_node, reading the fields straight from the dict so no
+    AST objects are rebuilt first. The dict is kept as the RunNode's
+    ast_node.
+
+    Raises:
+        CompileError: If the node kind is unknown
+    """
+    kind = node_dict["kind"]
+    compiler = _DICT_COMPILERS.get(kind)
+    if compiler is None:
+        raise CompileError(f"Unknown AST node kind: {kind}")
+    return compiler(node_dict)
 
 
 # ==================== Virtual Machine ====================
 
 
+# (stdlib.soma mtime, compiled program), shared by every VM (see _load_stdlib)
+_stdlib_compiled: Optional[tuple] = None
+
+
 class VM:
     """
     SOMA Virtual Machine.
@@ -1067,11 +1646,21 @@ class VM:
         Args:
             load_stdlib: If True (default), automatically load stdlib.soma
         """
+        # The AL is a plain list used through append/pop. A preallocated
+        # list with a separate top index is only faster when the index stays
+        # in one function's locals; here every builtin pushes and pops, so
+        # the index would live on the VM, cost an attribute write per
+        # operation, and break code that treats vm.al as the stack itself.
+        # Written out that way, a builtin-shaped push/push/pop/pop/push/pop
+        # sequence ran about 25% slower than append/pop, whose occasional
+        # resize is amortised by CPython's over-allocation anyway.
         self.al: List[Thing] = []
         self.store: Store = Store()
         self.register: Register = Register()
         self.current_block: Optional[Block] = None
         self.loaded_extensions: set = set()
+        # Emptied Registers from finished blocks, reused by Block.execute
+        self._register_pool: List[Register] = []
 
         if load_stdlib:
             self._load_stdlib()
@@ -1093,26 +1682,23 @@ class VM:
         Safe to call multiple times (idempotent).
         """
         # Find stdlib.soma relative to this file
-        import os
         vm_dir = os.path.dirname(os.path.abspath(__file__))
         stdlib_path = os.path.join(vm_dir, 'stdlib.soma')
 
-        if not os.path.exists(stdlib_path):
+        try:
+            mtime = os.stat(stdlib_path).st_mtime_ns
+        except FileNotFoundError:
             raise RuntimeError(f"stdlib.soma not found at {stdlib_path}")
 
-        # Load and execute stdlib code
-        with open(stdlib_path, 'r') as f:
-            stdlib_code = f.read()
-
-        # Execute stdlib using the same pipeline as run_soma_program
-        from soma.lexer import lex
-        from soma.parser import Parser
+        # Compiled code holds no VM state, so every VM can run the same
+        # compiled stdlib; it is only rebuilt when the file changes
+        global _stdlib_compiled
+        if _stdlib_compiled is None or _stdlib_compiled[0] != mtime:
+            with open(stdlib_path, 'r') as f:
+                stdlib_code = f.read()
+            _stdlib_compiled = (mtime, compile_source(stdlib_code))
 
-        tokens = lex(stdlib_code)
-        parser = Parser(tokens)
-        ast = parser.parse()
-        compiled = compile_program(ast)
-        compiled.execute(self)
+        _stdlib_compiled[1].execute(self)
 
     def execute_code(self, source: str):
         """
@@ -1121,19 +1707,15 @@ class VM:
         Args:
             source: SOMA source code string
         """
-        from soma.lexer import lex
-        from soma.parser import Parser
-
-        tokens = lex(source)
-        parser = Parser(tokens)
-        ast = parser.parse()
-        compiled = compile_program(ast)
-        compiled.execute(self)
+        compile_source(source).execute(self)
 
     def register_extension_builtin(self, name: str, builtin_fn):
         """
         Register an extension builtin under the use.* namespace.
 
+        Compiled calls such as '>use.python.foo' cache the resolved Cell on
+        their READ_STORE operand, so the path is walked once, not per call.
+
         Args:
             name: Fully qualified name (must start with 'use.')
             builtin_fn: Function taking (vm) as parameter
@@ -1167,7 +1749,6 @@ class VM:
 
         # Try to import extension module
         try:
-            import importlib
             extension_module = importlib.import_module(f'soma.extensions.{extension_name}')
         except ImportError as e:
             raise RuntimeError(f"Extension '{extension_name}' not found: {e}")
@@ -1226,20 +1807,22 @@ def builtin_choose(vm: VM):
     Raises:
         RuntimeError: If AL underflow
     """
-    if len(vm.al) < 3:
+    al = vm.al
+    if len(al) < 3:
         raise RuntimeError("AL underflow: >choose requires 3 values")
 
     # Pop in reverse order: false, true, condition (LIFO)
-    false_value = vm.al.pop()
-    true_value = vm.al.pop()
-    condition = vm.al.pop()
+    false_value = al.pop()
+    true_value = al.pop()
+    condition = al.pop()
 
-    # Evaluate condition: Nil/Void/False = False, everything else = True
-    is_true = not isinstance(condition, (NilSingleton, VoidSingleton, FalseSingleton))
+    # Evaluate condition: Nil/Void/False = False, everything else = True.
+    # They are singletons, so identity is the whole test.
+    is_true = condition is not Nil and condition is not Void and condition is not False_
 
     # Choose value and push to AL
     selected = true_value if is_true else false_value
-    vm.al.append(selected)
+    al.append(selected)
 
 
 def builtin_chain(vm: VM):
@@ -1255,28 +1838,29 @@ def builtin_chain(vm: VM):
     Raises:
         RuntimeError: If AL underflow or value is not a Block
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: >chain requires 1 value (block)")
 
-    # Peek at top of AL
-    thing = vm.al.pop()
-
-    # If it's a Block, execute it and loop
-    # The loop continues as long as the block leaves a block on AL
-    while isinstance(thing, (Block, BuiltinBlock)):
-        # Execute the block
-        thing.execute(vm)
-
-        # Check if there's another block on AL to continue the chain
-        if len(vm.al) > 0 and isinstance(vm.al[-1], (Block, BuiltinBlock)):
-            thing = vm.al.pop()
+    # Peek at top of AL: a non-block stays where it is (chain stops gracefully)
+    thing = al[-1]
+    if type(thing) not in _EXECUTABLE_TYPES:
+        return
+
+    # Execute the block and loop as long as it leaves a block on the AL.
+    # Blocks run straight through _execute_ops, as from the dispatch loop.
+    while True:
+        al.pop()
+        if type(thing) is Block:
+            _execute_ops(vm, thing.ops, thing.args, thing)
         else:
-            # No more blocks, stop chaining
-            break
+            thing.fn(vm)
 
-    # If the thing wasn't a block, just push it back (chain stops gracefully)
-    if not isinstance(thing, (Block, BuiltinBlock)):
-        vm.al.append(thing)
+        if not al:
+            break
+        thing = al[-1]
+        if type(thing) not in _EXECUTABLE_TYPES:
+            break
 
 
 # ==================== FFI Built-ins ====================
@@ -1298,24 +1882,50 @@ def builtin_lt(vm: VM):
     Raises:
         RuntimeError: If AL underflow or type mismatch
     """
-    if len(vm.al) < 2:
+    al = vm.al
+    if len(al) < 2:
         raise RuntimeError("AL underflow: < requires 2 values")
 
-    b = vm.al.pop()
-    a = vm.al.pop()
+    b = al.pop()
+    a = al.pop()
 
     # Type check: both must be same type
     if type(a) != type(b):
         raise RuntimeError(f"Type mismatch in <: cannot compare {type(a).__name__} and {type(b).__name__}")
 
-    if isinstance(a, int) and isinstance(b, int):
-        result = True_ if a < b else False_
-    elif isinstance(a, str) and isinstance(b, str):
+    # a and b share a type, so testing a is enough; exact int/str skip isinstance
+    if type(a) is int or type(a) is str or isinstance(a, (int, str)):
         result = True_ if a < b else False_
     else:
         raise RuntimeError(f"Cannot compare type {type(a).__name__} with <")
 
-    vm.al.append(result)
+    al.append(result)
+
+
+def _int_operands(al: list, name: str) -> tuple:
+    """
+    Pop the two int operands of arithmetic builtin name off al.
+
+    Returns (a, b), where b was on top.
+
+    Raises:
+        RuntimeError: If AL underflow or operands not integers
+    """
+    # The depth check stays even where a caller could prove it: the name is
+    # resolved at run time, so a nocheck variant would need a rebinding
+    # guard that costs as much as len() does.
+    if len(al) < 2:
+        raise RuntimeError(f"AL underflow: {name} requires 2 values")
+
+    b = al.pop()
+    a = al.pop()
+
+    # Exact ints (the usual case) skip the isinstance checks
+    if type(a) is not int or type(b) is not int:
+        if not isinstance(a, int) or not isinstance(b, int):
+            raise RuntimeError(f"Type error in {name}: expected int, got {type(a).__name__} and {type(b).__name__}")
+
+    return a, b
 
 
 def builtin_add(vm: VM):
@@ -1328,16 +1938,9 @@ def builtin_add(vm: VM):
     Raises:
         RuntimeError: If AL underflow or operands not integers
     """
-    if len(vm.al) < 2:
-        raise RuntimeError("AL underflow: + requires 2 values")
-
-    b = vm.al.pop()
-    a = vm.al.pop()
-
-    if not isinstance(a, int) or not isinstance(b, int):
-        raise RuntimeError(f"Type error in +: expected int, got {type(a).__name__} and {type(b).__name__}")
-
-    vm.al.append(a + b)
+    al = vm.al
+    a, b = _int_operands(al, "+")
+    al.append(a + b)
 
 
 def builtin_subtract(vm: VM):
@@ -1350,16 +1953,9 @@ def builtin_subtract(vm: VM):
     Raises:
         RuntimeError: If AL underflow or operands not integers
     """
-    if len(vm.al) < 2:
-        raise RuntimeError("AL underflow: - requires 2 values")
-
-    b = vm.al.pop()
-    a = vm.al.pop()
-
-    if not isinstance(a, int) or not isinstance(b, int):
-        raise RuntimeError(f"Type error in -: expected int, got {type(a).__name__} and {type(b).__name__}")
-
-    vm.al.append(a - b)
+    al = vm.al
+    a, b = _int_operands(al, "-")
+    al.append(a - b)
 
 
 def builtin_multiply(vm: VM):
@@ -1372,16 +1968,9 @@ def builtin_multiply(vm: VM):
     Raises:
         RuntimeError: If AL underflow or operands not integers
     """
-    if len(vm.al) < 2:
-        raise RuntimeError("AL underflow: * requires 2 values")
-
-    b = vm.al.pop()
-    a = vm.al.pop()
-
-    if not isinstance(a, int) or not isinstance(b, int):
-        raise RuntimeError(f"Type error in *: expected int, got {type(a).__name__} and {type(b).__name__}")
-
-    vm.al.append(a * b)
+    al = vm.al
+    a, b = _int_operands(al, "*")
+    al.append(a * b)
 
 
 def builtin_divide(vm: VM):
@@ -1396,19 +1985,13 @@ def builtin_divide(vm: VM):
     Raises:
         RuntimeError: If AL underflow, operands not integers, or division by zero
     """
-    if len(vm.al) < 2:
-        raise RuntimeError("AL underflow: / requires 2 values")
-
-    b = vm.al.pop()
-    a = vm.al.pop()
-
-    if not isinstance(a, int) or not isinstance(b, int):
-        raise RuntimeError(f"Type error in /: expected int, got {type(a).__name__} and {type(b).__name__}")
+    al = vm.al
+    a, b = _int_operands(al, "/")
 
     if b == 0:
         raise RuntimeError("Division by zero")
 
-    vm.al.append(a // b)
+    al.append(a // b)
 
 
 def builtin_modulo(vm: VM):
@@ -1421,19 +2004,36 @@ def builtin_modulo(vm: VM):
     Raises:
         RuntimeError: If AL underflow, operands not integers, or modulo by zero
     """
-    if len(vm.al) < 2:
-        raise RuntimeError("AL underflow: % requires 2 values")
-
-    b = vm.al.pop()
-    a = vm.al.pop()
-
-    if not isinstance(a, int) or not isinstance(b, int):
-        raise RuntimeError(f"Type error in %: expected int, got {type(a).__name__} and {type(b).__name__}")
+    al = vm.al
+    a, b = _int_operands(al, "%")
 
     if b == 0:
         raise RuntimeError("Modulo by zero")
 
-    vm.al.append(a % b)
+    al.append(a % b)
+
+
+# Text of a value by exact type, for print and debug.al.dump. Types not
+# listed (subclasses of str and int, FFI objects) take the fallback in each.
+_PRINT_TEXT = {
+    str: str,
+    int: str,
+    TrueSingleton: lambda _: "True",
+    FalseSingleton: lambda _: "False",
+    NilSingleton: lambda _: "Nil",
+    VoidSingleton: lambda _: "Void",
+}
+
+_AL_DUMP_TEXT = {
+    str: lambda s: f'({s})',
+    int: str,
+    TrueSingleton: lambda _: 'True',
+    FalseSingleton: lambda _: 'False',
+    NilSingleton: lambda _: 'Nil',
+    VoidSingleton: lambda _: 'Void',
+    Block: lambda _: 'Block',
+    CellRef: lambda ref: f'CellRef({id(ref.cell)})',
+}
 
 
 def builtin_print(vm: VM):
@@ -1448,24 +2048,18 @@ def builtin_print(vm: VM):
     Raises:
         RuntimeError: If AL underflow
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: print requires 1 value")
 
-    value = vm.al.pop()
+    value = al.pop()
 
     # Convert to string representation
-    if isinstance(value, str):
-        print(value)
-    elif isinstance(value, int):
+    text = _PRINT_TEXT.get(type(value))
+    if text is not None:
+        print(text(value))
+    elif isinstance(value, (str, int)):
         print(str(value))
-    elif isinstance(value, TrueSingleton):
-        print("True")
-    elif isinstance(value, FalseSingleton):
-        print("False")
-    elif isinstance(value, NilSingleton):
-        print("Nil")
-    elif isinstance(value, VoidSingleton):
-        print("Void")
     else:
         print(repr(value))
 
@@ -1479,30 +2073,29 @@ def builtin_debug_al_dump(vm: VM):
 
     Prints a representation of the AL to help with debugging.
     """
-    print(f"DEBUG AL [{len(vm.al)} items]: ", end="")
+    al = vm.al
+    print(f"DEBUG AL [{len(al)} items]: ", end="")
     items = []
-    for item in vm.al:
-        if isinstance(item, str):
+    for item in al:
+        text = _AL_DUMP_TEXT.get(type(item))
+        if text is not None:
+            items.append(text(item))
+        elif isinstance(item, str):
             items.append(f'({item})')
         elif isinstance(item, int):
             items.append(str(item))
-        elif isinstance(item, TrueSingleton):
-            items.append('True')
-        elif isinstance(item, FalseSingleton):
-            items.append('False')
-        elif isinstance(item, NilSingleton):
-            items.append('Nil')
-        elif isinstance(item, VoidSingleton):
-            items.append('Void')
-        elif isinstance(item, Block):
-            items.append('Block')
-        elif isinstance(item, CellRef):
-            items.append(f'CellRef({id(item.cell)})')
         else:
             items.append(f'{type(item).__name__}')
     print('[' + ', '.join(items) + ']')
 
 
+# debug.chain logs the first _DEBUG_CHAIN_BATCH iterations, then every
+# _DEBUG_CHAIN_BATCH-th one. Set SOMA_DEBUG_CHAIN_VERBOSE=1 to log them all.
+_DEBUG_CHAIN_VERBOSE = os.environ.get("SOMA_DEBUG_CHAIN_VERBOSE", "0") != "0"
+
+_DEBUG_CHAIN_BATCH = 32
+
+
 def builtin_debug_chain(vm: VM):
     """
     debug.chain: Instrumented version of chain that logs each iteration.
@@ -1515,6 +2108,9 @@ def builtin_debug_chain(vm: VM):
     - AL size before/after each block execution
     - Termination reason (Nil or no more blocks)
 
+    Long chains are logged in batches: the first 32 iterations, then every
+    32nd, then the last. Set SOMA_DEBUG_CHAIN_VERBOSE=1 to log every one.
+
     Use the backup/restore pattern:
         chain !backup.chain
         debug.chain !chain
@@ -1523,22 +2119,27 @@ def builtin_debug_chain(vm: VM):
 
     Includes safety limit of 1000 iterations to detect infinite loops.
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: >chain requires 1 value (block)")
 
     # Peek at top of AL
-    thing = vm.al.pop()
+    thing = al.pop()
     iteration = 0
     MAX_ITERATIONS = 1000
+    verbose = _DEBUG_CHAIN_VERBOSE
+    batch = _DEBUG_CHAIN_BATCH
 
     # If it's a Block, execute it and loop
-    while isinstance(thing, (Block, BuiltinBlock)):
+    while type(thing) in _EXECUTABLE_TYPES:
         iteration += 1
-        al_size_before = len(vm.al)
+        al_size_before = len(al)
+        logged = verbose or iteration <= batch or iteration % batch == 0
 
-        print(f"\n[DEBUG CHAIN] Iteration {iteration}")
-        print(f"  AL before: {al_size_before} items")
-        print(f"  → Executing Block")
+        if logged:
+            print(f"\n[DEBUG CHAIN] Iteration {iteration}")
+            print(f"  AL before: {al_size_before} items")
+            print(f"  → Executing Block")
 
         # Safety check for infinite loops
         if iteration >= MAX_ITERATIONS:
@@ -1550,23 +2151,28 @@ def builtin_debug_chain(vm: VM):
         # Execute the block
         thing.execute(vm)
 
-        al_size_after = len(vm.al)
-        print(f"  AL after: {al_size_after} items")
+        if logged:
+            print(f"  AL after: {len(al)} items")
 
         # Check if there's another block on AL to continue the chain
-        if len(vm.al) > 0 and isinstance(vm.al[-1], (Block, BuiltinBlock)):
-            thing = vm.al.pop()
+        if len(al) > 0 and type(al[-1]) in _EXECUTABLE_TYPES:
+            thing = al.pop()
         else:
             # No more blocks, stop chaining
-            print(f"  → Chain terminating: no more blocks on AL")
+            if not logged:
+                print(f"\n[DEBUG CHAIN] Iteration {iteration}")
+                print(f"  AL before: {al_size_before} items")
+                print(f"  → Executing Block")
+                print(f"  AL after: {len(al)} items")
+            print(f"  → Chain terminating: no more blocks on AL after {iteration} iterations")
             break
 
     # If the thing wasn't a block, check if it's Nil
-    if not isinstance(thing, (Block, BuiltinBlock)):
+    if type(thing) not in _EXECUTABLE_TYPES:
         if isinstance(thing, NilSingleton):
             print(f"\n[DEBUG CHAIN] → Nil encountered, stopping")
         else:
-            vm.al.append(thing)
+            al.append(thing)
 
 
 def builtin_debug_choose(vm: VM):
@@ -1587,14 +2193,15 @@ def builtin_debug_choose(vm: VM):
         ... your code ...
         backup.choose !choose
     """
-    if len(vm.al) < 3:
+    al = vm.al
+    if len(al) < 3:
         raise RuntimeError("Choose requires [condition, true_block, false_block] on AL")
 
-    al_size_before = len(vm.al)
+    al_size_before = len(al)
 
-    false_block = vm.al.pop()
-    true_block = vm.al.pop()
-    condition = vm.al.pop()
+    false_block = al.pop()
+    true_block = al.pop()
+    condition = al.pop()
 
     print(f"\n[DEBUG CHOOSE]")
     print(f"  Condition: {type(condition).__name__}")
@@ -1603,32 +2210,32 @@ def builtin_debug_choose(vm: VM):
     # Determine which branch based on truthiness
     # In SOMA: True_, non-zero ints, non-empty strings are truthy
     # False_, Nil, Void, 0, empty string are falsy
-    if isinstance(condition, (TrueSingleton,)):
+    if condition is True_:
         print(f"  → Taking TRUE branch")
-        vm.al.append(true_block)
-    elif isinstance(condition, (FalseSingleton, VoidSingleton, NilSingleton)):
+        al.append(true_block)
+    elif condition is False_ or condition is Void or condition is Nil:
         print(f"  → Taking FALSE branch")
-        vm.al.append(false_block)
+        al.append(false_block)
     elif isinstance(condition, int):
         if condition != 0:
             print(f"  → Taking TRUE branch (non-zero int: {condition})")
-            vm.al.append(true_block)
+            al.append(true_block)
         else:
             print(f"  → Taking FALSE branch (zero)")
-            vm.al.append(false_block)
+            al.append(false_block)
     elif isinstance(condition, str):
         if condition != "":
             print(f"  → Taking TRUE branch (non-empty string)")
-            vm.al.append(true_block)
+            al.append(true_block)
         else:
             print(f"  → Taking FALSE branch (empty string)")
-            vm.al.append(false_block)
+            al.append(false_block)
     else:
         # Default: truthy for everything else
         print(f"  → Taking TRUE branch (truthy value)")
-        vm.al.append(true_block)
+        al.append(true_block)
 
-    al_size_after = len(vm.al)
+    al_size_after = len(al)
     print(f"  AL after: {al_size_after} items")
 
 
@@ -1643,10 +2250,11 @@ def builtin_debug_error(vm: VM):
     rather than trying to propagate error state. SOMA uses state-passing,
     not exceptions, so this is explicitly a debug tool.
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("ASSERT FAILED: (no message provided)")
 
-    message = vm.al.pop()
+    message = al.pop()
     if isinstance(message, str):
         raise RuntimeError(f"ASSERT FAILED: {message}")
     else:
@@ -1665,12 +2273,11 @@ def builtin_debug_graph_dump(vm: VM):
     - All fields and their values
     - Cycle detection (references to already-visited nodes)
     """
-    import sys
-
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("debug.graph.dump requires a value on AL")
 
-    value = vm.al.pop()
+    value = al.pop()
 
     # Track visited cells by id
     visited = {}  # id -> node_number
@@ -1746,10 +2353,11 @@ def builtin_debug_graph_draw(vm: VM):
     Prints a tree-style visualisation using box-drawing characters,
     similar to the Unix 'tree' command.
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("debug.graph.draw requires a value on AL")
 
-    value = vm.al.pop()
+    value = al.pop()
 
     # Track visited cells by id
     visited = {}  # id -> node_number
@@ -1881,16 +2489,17 @@ def builtin_concat(vm: VM):
     Raises:
         RuntimeError: If AL underflow or operands not strings
     """
-    if len(vm.al) < 2:
+    al = vm.al
+    if len(al) < 2:
         raise RuntimeError("AL underflow: concat requires 2 values")
 
-    b = vm.al.pop()
-    a = vm.al.pop()
+    b = al.pop()
+    a = al.pop()
 
     if not isinstance(a, str) or not isinstance(b, str):
         raise RuntimeError(f"Type error in concat: expected string, got {type(a).__name__} and {type(b).__name__}")
 
-    vm.al.append(a + b)
+    al.append(a + b)
 
 
 def builtin_to_string(vm: VM):
@@ -1903,15 +2512,16 @@ def builtin_to_string(vm: VM):
     Raises:
         RuntimeError: If AL underflow or value not an integer
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: to_string requires 1 value")
 
-    value = vm.al.pop()
+    value = al.pop()
 
     if not isinstance(value, int):
         raise RuntimeError(f"Type error in to_string: expected int, got {type(value).__name__}")
 
-    vm.al.append(str(value))
+    al.append(str(value))
 
 
 def builtin_to_int(vm: VM):
@@ -1926,19 +2536,44 @@ def builtin_to_int(vm: VM):
     Raises:
         RuntimeError: If AL underflow or value not a string
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: to_int requires 1 value")
 
-    value = vm.al.pop()
+    value = al.pop()
 
     if not isinstance(value, str):
         raise RuntimeError(f"Type error in to_int: expected string, got {type(value).__name__}")
 
     try:
         result = int(value)
-        vm.al.append(result)
+        al.append(result)
     except ValueError:
-        vm.al.append(Nil)
+        al.append(Nil)
+
+
+def _fold_to_int(value: str) -> Thing:
+    """toInt on a literal, as builtin_to_int computes it."""
+    try:
+        return int(value)
+    except ValueError:
+        return Nil
+
+
+# Pure builtins that _link folds when applied to literals:
+# name -> (builtin function, operand count, operand types, function
+# computing the result). All operands must share one of the types.
+_FOLDABLE_BUILTINS = {
+    "+": (builtin_add, 2, (int,), operator.add),
+    "-": (builtin_subtract, 2, (int,), operator.sub),
+    "*": (builtin_multiply, 2, (int,), operator.mul),
+    "/": (builtin_divide, 2, (int,), operator.floordiv),
+    "%": (builtin_modulo, 2, (int,), operator.mod),
+    "<": (builtin_lt, 2, (int, str), lambda a, b: True_ if a < b else False_),
+    "concat": (builtin_concat, 2, (str,), operator.add),
+    "toString": (builtin_to_string, 1, (int,), str),
+    "toInt": (builtin_to_int, 1, (str,), _fold_to_int),
+}
 
 
 def builtin_is_void(vm: VM):
@@ -1953,12 +2588,13 @@ def builtin_is_void(vm: VM):
     Raises:
         RuntimeError: If AL underflow
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: IsVoid requires 1 value")
 
-    value = vm.al.pop()
-    result = True_ if isinstance(value, VoidSingleton) else False_
-    vm.al.append(result)
+    value = al.pop()
+    result = True_ if value is Void else False_
+    al.append(result)
 
 
 def builtin_is_nil(vm: VM):
@@ -1973,12 +2609,13 @@ def builtin_is_nil(vm: VM):
     Raises:
         RuntimeError: If AL underflow
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: IsNil requires 1 value")
 
-    value = vm.al.pop()
-    result = True_ if isinstance(value, NilSingleton) else False_
-    vm.al.append(result)
+    value = al.pop()
+    result = True_ if value is Nil else False_
+    al.append(result)
 
 
 def builtin_debug_type(vm: VM):
@@ -2008,10 +2645,11 @@ def builtin_debug_type(vm: VM):
     Raises:
         RuntimeError: If AL underflow
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: debug.type requires 1 value")
 
-    value = vm.al.pop()
+    value = al.pop()
 
     if isinstance(value, int):
         type_name = "Int"
@@ -2036,7 +2674,7 @@ def builtin_debug_type(vm: VM):
     else:
         type_name = type(value).__name__
 
-    vm.al.append(type_name)
+    al.append(type_name)
 
 
 def builtin_debug_id(vm: VM):
@@ -2061,16 +2699,17 @@ def builtin_debug_id(vm: VM):
     Raises:
         RuntimeError: If AL underflow
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: debug.id requires 1 value")
 
-    value = vm.al.pop()
+    value = al.pop()
 
     # For CellRef, get the id of the underlying Cell, not the wrapper
     if isinstance(value, CellRef):
-        vm.al.append(id(value.cell))
+        al.append(id(value.cell))
     else:
-        vm.al.append(id(value))
+        al.append(id(value))
 
 
 def builtin_use(vm: VM):
@@ -2086,10 +2725,11 @@ def builtin_use(vm: VM):
     Raises:
         RuntimeError: If AL underflow, argument not string, or extension not found
     """
-    if len(vm.al) < 1:
+    al = vm.al
+    if len(al) < 1:
         raise RuntimeError("AL underflow: use requires 1 value (extension name)")
 
-    extension_name = vm.al.pop()
+    extension_name = al.pop()
 
     if not isinstance(extension_name, str):
         raise RuntimeError(f"use: expected string extension name, got {type(extension_name).__name__}")
@@ -2116,17 +2756,8 @@ def run_soma_program(source: str) -> List[Thing]:
         CompileError: If compilation fails
         RuntimeError: If execution fails
     """
-    # 1. Lex
-    from soma.lexer import lex
-    tokens = lex(source)
-
-    # 2. Parse
-    from soma.parser import Parser
-    parser = Parser(tokens)
-    ast = parser.parse()
-
-    # 3. Compile
-    compiled = compile_program(ast)
+    # 1-3. Lex, parse and compile
+    compiled = compile_source(source)
 
     # 4. Execute
     vm = VM()
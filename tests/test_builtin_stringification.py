@@ -23,47 +23,39 @@ from soma.vm import run_soma_program
 class TestBuiltinOperatorValidation(unittest.TestCase):
     """Test that builtin operators in text contexts raise helpful errors."""
 
-    def test_minus_operator_raises_error(self):
-        """Test that - operator (without parens) raises TypeError with helpful message."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            code = f"""
+    # Loads the markdown extension and selects the HTML emitter
+    PREAMBLE = """
             (python) >use
             (markdown) >use
             >md.start
             md.htmlEmitter >md.emitter
+"""
 
+    # The error tests raise before >md.render, so nothing is written there
+    UNUSED_PATH = os.devnull
+
+    def test_minus_operator_raises_error(self):
+        """Test that - operator (without parens) raises TypeError with helpful message."""
+        code = self.PREAMBLE + f"""
             (humans ) - ( lengthy explanations) >md.t
             >md.p
 
-            ({temp_path}) >md.render
+            ({self.UNUSED_PATH}) >md.render
             """
 
-            with self.assertRaises(TypeError) as cm:
-                run_soma_program(code)
+        with self.assertRaises(TypeError) as cm:
+            run_soma_program(code)
 
-            error_msg = str(cm.exception)
-            self.assertIn("Text concatenation (>md.t) requires string items", error_msg)
-            self.assertIn("BuiltinBlock", error_msg)
-            self.assertIn("(-)", error_msg)  # Hint about correct syntax
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        error_msg = str(cm.exception)
+        self.assertIn("Text concatenation (>md.t) requires string items", error_msg)
+        self.assertIn("BuiltinBlock", error_msg)
+        self.assertIn("(-)", error_msg)  # Hint about correct syntax
 
     def test_minus_operator_correct_syntax(self):
         """Test that (-) (with parens) works correctly."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            code = f"""
-            (python) >use
-            (markdown) >use
-            >md.start
-            md.htmlEmitter >md.emitter
-
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_path = os.path.join(tmpdir, 'output.html')
+            code = self.PREAMBLE + f"""
             (humans ) (-) ( lengthy explanations) >md.t
             >md.p
 
@@ -74,62 +66,36 @@ class TestBuiltinOperatorValidation(unittest.TestCase):
 
             # Should render as plain dash
             self.assertIn("humans - lengthy explanations", content)
-        finally:
-            os.unlink(temp_path)
 
     def test_plus_operator_raises_error(self):
         """Test that + operator raises TypeError."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            code = f"""
-            (python) >use
-            (markdown) >use
-            >md.start
-            md.htmlEmitter >md.emitter
-
+        code = self.PREAMBLE + f"""
             (one ) + ( two) >md.t
             >md.p
 
-            ({temp_path}) >md.render
+            ({self.UNUSED_PATH}) >md.render
             """
 
-            with self.assertRaises(TypeError) as cm:
-                run_soma_program(code)
+        with self.assertRaises(TypeError) as cm:
+            run_soma_program(code)
 
-            error_msg = str(cm.exception)
-            self.assertIn("Text concatenation", error_msg)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        error_msg = str(cm.exception)
+        self.assertIn("Text concatenation", error_msg)
 
     def test_comparison_operator_raises_error(self):
         """Test that < operator raises TypeError."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            code = f"""
-            (python) >use
-            (markdown) >use
-            >md.start
-            md.htmlEmitter >md.emitter
-
+        code = self.PREAMBLE + f"""
             (a ) < ( b) >md.t
             >md.p
 
-            ({temp_path}) >md.render
+            ({self.UNUSED_PATH}) >md.render
             """
 
-            with self.assertRaises(TypeError) as cm:
-                run_soma_program(code)
+        with self.assertRaises(TypeError) as cm:
+            run_soma_program(code)
 
-            error_msg = str(cm.exception)
-            self.assertIn("Text concatenation", error_msg)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        error_msg = str(cm.exception)
+        self.assertIn("Text concatenation", error_msg)
 
 
 if __name__ == '__main__':
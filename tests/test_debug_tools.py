@@ -14,6 +14,7 @@ import unittest
 import re
 import io
 import sys
+from unittest import mock
 from soma.vm import run_soma_program, VM, compile_program, Nil, True_, False_
 from soma.lexer import lex
 from soma.parser import Parser
@@ -142,6 +143,30 @@ class TestDebugChain(unittest.TestCase):
         self.assertIn('b', output)
         self.assertIn('c', output)
 
+    def test_debug_chain_batches_long_chains(self):
+        """Test that debug.chain logs long chains in batches of 32."""
+        code = '''
+        chain !backup.chain
+        debug.chain !chain
+
+        0 !i
+        { i 1 >+ !i  i 100 >< >block Nil >choose }
+        >chain
+
+        backup.chain !chain
+        '''
+        with mock.patch("soma.vm._DEBUG_CHAIN_VERBOSE", False):
+            output, _ = self.capture_output(code)
+
+        for shown in (1, 31, 32, 64, 96, 100):
+            self.assertRegex(output, rf'Iteration {shown}\n')
+        for hidden in (33, 50, 99):
+            self.assertNotRegex(output, rf'Iteration {hidden}\n')
+
+        # The unbatched final iteration is logged in full, then summarised
+        self.assertRegex(output, r'Iteration 100\n  AL before: \d+ items\n  → Executing Block\n')
+        self.assertRegex(output, r'Chain terminating: no more blocks on AL after 100 iterations')
+
     def test_debug_chain_shows_block_execution(self):
         """Test that debug.chain shows when blocks are executed."""
         code = '''
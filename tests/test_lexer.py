@@ -9,11 +9,13 @@ These tests are designed to lock in behaviour as we go:
 - illegal numeric literals
 - whitespace insensitivity around most boundaries
 - basic behaviour when '!' or '>' appear inside names
+- modifier target rules (checked by the parser, see lex_and_parse)
 """
 
 import unittest
 
 from soma.lexer import lex, TokenKind, LexError
+from soma.parser import Parser, ParseError
 
 
 def kinds(tokens):
@@ -26,6 +28,11 @@ def values(tokens):
     return [t.value for t in tokens[:-1]]
 
 
+def lex_and_parse(source):
+    """Helper: lex and parse; modifier targets are checked by the parser."""
+    return Parser(lex(source)).parse()
+
+
 class TestNumbersAndExecute(unittest.TestCase):
     def test_23_exec_print(self):
         tokens = lex("23 >print")
@@ -201,11 +208,11 @@ class TestStoreModifier(unittest.TestCase):
     def test_store_cannot_attach_to_positive_int(self):
         # !+34 is illegal: attached modifier cannot target a numeric-like token
         with self.assertRaises(LexError):
-            lex("!+34")
+            lex_and_parse("!+34")
 
     def test_store_cannot_attach_to_negative_int(self):
         with self.assertRaises(LexError):
-            lex("!-23")
+            lex_and_parse("!-23")
 
     def test_store_standalone_before_negative_int_is_ok(self):
         tokens = lex("! -23")
@@ -216,17 +223,17 @@ class TestStoreModifier(unittest.TestCase):
     def test_store_cannot_attach_to_modifier_target_bang(self):
         # !!a is illegal: attached '!' target starts with '!'
         with self.assertRaises(LexError):
-            lex("!!a")
+            lex_and_parse("!!a")
 
     def test_store_cannot_attach_to_modifier_target_exec(self):
         # !>stdout is illegal: attached '!' target starts with '>'
         with self.assertRaises(LexError):
-            lex("!>stdout")
+            lex_and_parse("!>stdout")
 
     def test_store_cannot_attach_to_modifier_target_exec_plus(self):
         # !>+ is illegal: attached '!' target starts with '>'
         with self.assertRaises(LexError):
-            lex("!>+")
+            lex_and_parse("!>+")
 
     def test_store_attached_to_single_greater_is_allowed(self):
         # !> is allowed: store to the path ">"
@@ -248,11 +255,11 @@ class TestExecModifierEdgeCases(unittest.TestCase):
 
     def test_exec_cannot_attach_to_positive_int(self):
         with self.assertRaises(LexError):
-            lex(">+34")
+            lex_and_parse(">+34")
 
     def test_exec_cannot_attach_to_negative_int(self):
         with self.assertRaises(LexError):
-            lex(">-23")
+            lex_and_parse(">-23")
 
     def test_exec_standalone_before_negative_int_is_ok(self):
         tokens = lex("> -23")
@@ -262,12 +269,12 @@ class TestExecModifierEdgeCases(unittest.TestCase):
     def test_exec_cannot_attach_to_modifier_target_exec(self):
         # >>foo is illegal: attached '>' target starts with '>'
         with self.assertRaises(LexError):
-            lex(">>foo")
+            lex_and_parse(">>foo")
 
     def test_exec_cannot_attach_to_modifier_target_store(self):
         # >!dog is illegal: attached '>' target starts with '!'
         with self.assertRaises(LexError):
-            lex(">!dog")
+            lex_and_parse(">!dog")
 
     def test_exec_attached_to_single_bang_is_allowed(self):
         tokens = lex(">!")
@@ -371,7 +378,7 @@ class TestBlocks(unittest.TestCase):
     def test_store_cannot_attach_to_block(self):
         # !{>print} is illegal: attached '!' cannot target a block
         with self.assertRaises(LexError):
-            lex("!{>print}")
+            lex_and_parse("!{>print}")
 
     def test_store_word_before_block_is_ok(self):
         # ! {>print} => PATH("!"), LBRACE, EXEC, PATH("print"), RBRACE
@@ -437,9 +444,9 @@ class TestCompoundSyntax(unittest.TestCase):
 
         def test_ops(a, b):
             with self.assertRaises(LexError):
-                lex(a+">>="+b)
+                lex_and_parse(a+">>="+b)
             with self.assertRaises(LexError):
-                lex(a+">!="+b)
+                lex_and_parse(a+">!="+b)
             tokens = lex(a+">=>"+b)
             self.assertEqual(kinds(tokens), [TokenKind.EXEC, TokenKind.PATH])
             self.assertEqual(values(tokens), [">", "=>"])
@@ -468,9 +475,9 @@ class TestCompoundSyntax(unittest.TestCase):
         test_ops("", "")
 
         with self.assertRaises(LexError):
-            lex("{>>=}")
+            lex_and_parse("{>>=}")
         with self.assertRaises(LexError):
-            lex("{>!=}")
+            lex_and_parse("{>!=}")
         tokens = lex("{>=>}")
         self.assertEqual(
             kinds(tokens),
@@ -633,11 +640,11 @@ class TestStrings(unittest.TestCase):
 
     def test_store_cannot_attach_to_string(self):
         with self.assertRaises(LexError):
-            lex("!(foo)")
+            lex_and_parse("!(foo)")
 
     def test_exec_cannot_attach_to_string(self):
         with self.assertRaises(LexError):
-            lex(">(foo)")
+            lex_and_parse(">(foo)")
 
 
 class TestStringIntegrationExamples(unittest.TestCase):
@@ -902,5 +909,70 @@ class TestComments(unittest.TestCase):
         self.assertEqual(values(tokens), ["a)b"])
 
 
+class TestModifierTargetsCheckedByParser(unittest.TestCase):
+    def test_lexer_emits_attached_modifier_before_modifier(self):
+        tokens = lex("!!a")
+        self.assertEqual(
+            kinds(tokens),
+            [TokenKind.STORE, TokenKind.STORE, TokenKind.PATH],
+        )
+
+    def test_error_is_reported_at_the_modifier(self):
+        with self.assertRaises(LexError) as ctx:
+            lex_and_parse("1\n  >(foo)")
+        self.assertEqual((ctx.exception.line, ctx.exception.col), (2, 3))
+        self.assertIn("string literal", ctx.exception.message)
+
+    def test_modifier_before_modifier_on_block_passes_target_check(self):
+        # '>>{' lexes as EXEC EXEC LBRACE and is not a modifier target
+        # error; the grammar then rejects '>' followed by '>'.
+        tokens = lex(">>{ 1 }")
+        self.assertEqual(
+            kinds(tokens)[:3],
+            [TokenKind.EXEC, TokenKind.EXEC, TokenKind.LBRACE],
+        )
+        with self.assertRaises(ParseError):
+            lex_and_parse(">>{ 1 }")
+
+    def test_store_modifier_on_block_behind_modifier_is_lex_error(self):
+        for source in (">!{ 1 }", "!!{1}"):
+            with self.assertRaises(LexError) as ctx:
+                lex_and_parse(source)
+            self.assertEqual(ctx.exception.message, "Modifier '!' cannot target a block")
+            self.assertEqual((ctx.exception.line, ctx.exception.col), (1, 2))
+
+    def test_earlier_modifier_error_wins_over_later_error(self):
+        # Errors come out in source order, whichever layer finds them
+        cases = {
+            "!{ 1 } 12abc": "Modifier '!' cannot target a block",
+            ">>1x": "Modifier '>' cannot target '>'...",
+            ">(unterminated": "Modifier '>' cannot target a string literal",
+            "}>(s)": "Modifier '>' cannot target a string literal",
+        }
+        for source, message in cases.items():
+            with self.assertRaises(LexError) as ctx:
+                lex_and_parse(source)
+            self.assertEqual(ctx.exception.message, message)
+
+
+class TestLexCache(unittest.TestCase):
+    def test_repeated_lex_returns_equal_tokens(self):
+        first = lex("1 !x >x")
+        second = lex("1 !x >x")
+        self.assertEqual(kinds(first), kinds(second))
+        self.assertEqual(values(first), values(second))
+
+    def test_returned_list_is_a_fresh_copy(self):
+        first = lex("1 !x")
+        first.clear()
+        second = lex("1 !x")
+        self.assertEqual(kinds(second), [TokenKind.INT, TokenKind.STORE, TokenKind.PATH])
+
+    def test_errors_are_raised_on_every_call(self):
+        for _ in range(2):
+            with self.assertRaises(LexError):
+                lex("12abc")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -826,6 +826,85 @@ class TestSourceLocations(unittest.TestCase):
         ast = parse("1 2 3")
         self.assertIn("location", ast)
 
+    def test_locations_come_from_tokens(self):
+        """Test that node locations give the token's line, column and length."""
+        ast = parse("42\n  !foo.bar (hi)")
+        self.assertEqual(
+            ast["body"][0]["location"], {"line": 1, "column": 1, "length": 2}
+        )
+        store = ast["body"][1]
+        self.assertEqual(store["location"], {"line": 2, "column": 3, "length": 1})
+        self.assertEqual(
+            store["target"]["location"], {"line": 2, "column": 4, "length": 7}
+        )
+        self.assertEqual(
+            ast["body"][2]["location"], {"line": 2, "column": 12, "length": 4}
+        )
+
+    def test_block_location_spans_braces(self):
+        """Test that a block's location covers it from '{' to '}'."""
+        ast = parse("{ 1 2 }")
+        self.assertEqual(
+            ast["body"][0]["location"], {"line": 1, "column": 1, "length": 7}
+        )
+
+
+class TestAstToDict(unittest.TestCase):
+    """Tests for the dictionary conversion of hand-built ASTs."""
+
+    def test_deeply_nested_blocks_convert(self):
+        """Test that conversion does not recurse once per nesting level."""
+        from soma.parser import _ast_to_dict, BlockNode, IntNode, Program
+
+        depth = 5000
+        node = IntNode(1)
+        for _ in range(depth):
+            node = BlockNode([node])
+        result = _ast_to_dict(Program([node]))
+
+        inner = result["body"][0]
+        for _ in range(depth - 1):
+            inner = inner["body"][0]
+        self.assertEqual(inner["body"][0]["value"], 1)
+
+    def test_shared_block_is_converted_once(self):
+        """Test that a block object used twice yields one shared dict."""
+        from soma.parser import _ast_to_dict, BlockNode, ExecNode, IntNode, Program
+
+        block = BlockNode([IntNode(1)])
+        result = _ast_to_dict(Program([block, ExecNode(block)]))
+        self.assertIs(result["body"][0], result["body"][1]["target"])
+
+    def test_nodes_hash_structurally(self):
+        """Test that equal nodes hash equally, ignoring location."""
+        from soma.parser import BlockNode, IntNode, ValuePath
+
+        a = BlockNode([IntNode(1, (1, 1, 1)), ValuePath(["x", "y"])])
+        b = BlockNode([IntNode(1, (5, 3, 1)), ValuePath(["x", "y"])])
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b}), 1)
+
+
+class TestParseCache(unittest.TestCase):
+    """Tests that repeated parses of one source stay independent."""
+
+    def test_repeated_parse_returns_fresh_dicts(self):
+        """Test that editing one result does not affect the next."""
+        first = parse("1 >print")
+        first["body"].clear()
+        second = parse("1 >print")
+        self.assertEqual(len(second["body"]), 2)
+        self.assertEqual(second["body"][0]["value"], 1)
+
+    def test_repeated_parse_returns_fresh_components(self):
+        """Test that editing a path's components does not affect the next parse."""
+        for source in ("a.b 1", "a.b. 1"):
+            first = parse(source)
+            first["body"][0]["components"].append("zzz")
+            second = parse(source)
+            self.assertEqual(second["body"][0]["components"], ["a", "b"])
+
 
 class TestErrorMessages(unittest.TestCase):
     """Tests for clear error messages with helpful information."""
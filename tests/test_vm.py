@@ -28,6 +28,7 @@ from soma.vm import (
     compile_node,
     RunNode,
     CompiledProgram,
+    Op,
     Cell,
     Store,
     Register,
@@ -38,6 +39,7 @@ from soma.vm import (
     Nil,
     VoidSingleton,
     NilSingleton,
+    False_,
     RuntimeError as VMRuntimeError,
     CompileError,
 )
@@ -250,6 +252,134 @@ class TestCompilation(unittest.TestCase):
         self.assertIsInstance(compiled.run_nodes[1], RunNode)
         self.assertIsInstance(compiled.run_nodes[2], RunNode)
 
+    def test_compile_program_from_dict(self):
+        """Test dict ASTs compile directly, keeping the dict as ast_node."""
+        ast = parse("{ 1 !_.x } >chain")
+        compiled = compile_program(ast)
+
+        self.assertIs(compiled.run_nodes[0].ast_node, ast["body"][0])
+        self.assertEqual(compiled.run_nodes[1].ops, [Op.EXEC_STORE1])
+
+    def test_compiled_program_links_opcodes(self):
+        """Test CompiledProgram concatenates its statements' opcodes."""
+        compiled = compile_program(parse("x 2 >+"))
+
+        expected_ops = []
+        for rn in compiled.run_nodes:
+            expected_ops.extend(rn.ops)
+        self.assertEqual(compiled.ops, expected_ops)
+        self.assertEqual(len(compiled.args), len(compiled.ops))
+        # >+ runs the top-level Store path + in a single op
+        self.assertEqual(compiled.run_nodes[2].ops, [Op.EXEC_STORE1])
+        self.assertEqual(compiled.run_nodes[2].args, ["+"])
+
+    def test_compile_folds_int_arithmetic(self):
+        """Test literal arithmetic folds to one op, chains included."""
+        compiled = compile_program(parse("1 2 >+ 3 >* 4 2 >< 5 0 >/"))
+
+        self.assertEqual(compiled.ops[:2], [Op.PUSH_FOLDED, Op.PUSH_FOLDED])
+        self.assertEqual(compiled.args[0][0], 9)
+        # Division by zero is left to raise at run time
+        self.assertEqual(compiled.ops[2:], [Op.PUSH, Op.PUSH, Op.EXEC_STORE1])
+
+    def test_compile_folds_pure_block_body(self):
+        """Test a Block of pure builtins on literals runs as one push."""
+        compiled = compile_program(parse("{ 6 7 >* >toString (!) >concat (12) >toInt }"))
+        block = compiled.args[0]
+
+        self.assertEqual(block.ops, [Op.PUSH_FOLDED, Op.PUSH_FOLDED])
+        self.assertEqual([arg[0] for arg in block.args], ["42!", 12])
+
+        vm = VM(load_stdlib=False)
+        block.execute(vm)
+        self.assertEqual(vm.al, ["42!", 12])
+
+    def test_folded_arithmetic_honours_rebound_builtin(self):
+        """Test a folded value is not used once its builtin is rebound."""
+        vm = VM(load_stdlib=False)
+        compiled = compile_program(parse("2 3 >+ 1 >-"))
+
+        compiled.execute(vm)
+        compile_program(parse("{ >* } !+")).execute(vm)
+        compiled.execute(vm)
+        self.assertEqual(vm.al, [4, 5])
+
+    def test_hot_block_runs_generated_code(self):
+        """Test a Block run often enough switches to generated code, unchanged."""
+        vm = VM(load_stdlib=False)
+        compile_program(parse("0 !n { n 3 >+ !n  n 2 >< } !step")).execute(vm)
+        block = vm.store.read_value(["step"])
+
+        for _ in range(60):
+            block.execute(vm)
+        self.assertIsNotNone(block.fast_execute)
+        self.assertEqual(vm.store.read_value(["n"]), 180)
+        self.assertEqual(vm.al, [False_] * 60)
+
+        compile_program(parse("{ >* } !+")).execute(vm)
+        block.execute(vm)
+        self.assertEqual(vm.store.read_value(["n"]), 540)
+
+    def test_compile_path_operand_is_tuple(self):
+        """Test path operands are frozen to tuples at compile time."""
+        run_node = compile_node(ValuePath(components=["_", "x", "y"], location={}))
+
+        self.assertEqual(run_node.ops, [Op.READ_REGISTER])
+        self.assertEqual(run_node.args, [("_", "x", "y")])
+
+    def test_compile_path_operand_is_shared(self):
+        """Test repeated occurrences of a path share one operand tuple."""
+        first = compile_node(ValuePath(components=["_", "x", "y"], location={}))
+        second = compile_program(parse("{ 1 !_.x.y }")).run_nodes[0].args[0].body[1]
+
+        self.assertIs(first.args[0], second.args[0])
+
+    def test_compile_rejects_malformed_register_path(self):
+        """Test a root like _x is rejected at compile time."""
+        with self.assertRaises(CompileError) as ctx:
+            compile_node(ValuePath(components=["_x"], location={}))
+        self.assertIn("Invalid Register path '_x'", str(ctx.exception))
+
+        with self.assertRaises(CompileError):
+            compile_node(StoreNode(target=ValuePath(components=["_temp"], location={}), location={}))
+
+    def test_underscore_prefixed_store_path(self):
+        """Test a multi-component path rooted at _x is a Store path."""
+        vm = VM(load_stdlib=False)
+        compile_program(parse("5 !_x.y _x.y _x.y. !r")).execute(vm)
+
+        self.assertEqual(vm.al, [5])
+        self.assertEqual(vm.store.read_value(["_x", "y"]), 5)
+
+    def test_compile_single_register_child(self):
+        """Test _.x reads and writes compile to their specialised ops."""
+        read = compile_node(ValuePath(components=["_", "x"], location={}))
+        write = compile_node(StoreNode(target=ValuePath(components=["_", "x"], location={}), location={}))
+
+        self.assertEqual((read.ops, read.args), ([Op.READ_REGISTER1], ["x"]))
+        self.assertEqual((write.ops, write.args), ([Op.STORE_REGISTER1], ["x"]))
+
+        vm = VM(load_stdlib=False)
+        vm.al.append(5)
+        write.execute(vm)
+        read.execute(vm)
+        self.assertEqual(vm.al, [5])
+
+    def test_compile_store_ops(self):
+        """Test each kind of store compiles to its own op."""
+        cases = {
+            "!a": Op.STORE_STORE1,
+            "!a.b": Op.STORE_STORE,
+            "!a.b.": Op.STORE_REF_STORE,
+            "!_.a.b": Op.STORE_REGISTER,
+            "!_.a.": Op.STORE_REF_REGISTER,
+        }
+        for source, op in cases.items():
+            run_node = compile_program(parse(source)).run_nodes[0]
+            self.assertEqual(run_node.ops, [op], source)
+            if op != Op.STORE_STORE1:
+                self.assertIsInstance(run_node.args[0], tuple, source)
+
 
 class TestVMExecution(unittest.TestCase):
     """Tests for VM execution primitives."""
@@ -262,6 +392,16 @@ class TestVMExecution(unittest.TestCase):
         self.assertIsInstance(vm.register, Register)
         self.assertIsNone(vm.current_block)
 
+    def test_stdlib_compiled_once(self):
+        """Test VMs share one compiled stdlib but keep separate Stores."""
+        vm1 = VM()
+        vm2 = VM()
+        self.assertIs(vm1.store.read_value(["not"]), vm2.store.read_value(["not"]))
+
+        vm1.execute_code("{ } !not")
+        vm2.execute_code("True >not")
+        self.assertIs(vm2.al[0], False_)
+
     def test_push_int_to_al(self):
         """Test pushing int onto AL."""
         vm = VM(load_stdlib=False)
@@ -327,6 +467,46 @@ class TestStoreOperations(unittest.TestCase):
         # a should be Void (auto-vivified)
         self.assertIsInstance(vm.store.read_value(["a"]), VoidSingleton)
 
+    def test_store_path_cache_follows_graph_changes(self):
+        """Test a compiled Store read sees CellRef rewiring and deletion."""
+        vm = VM(load_stdlib=False)
+        reader = compile_program(parse("ptr.x"))
+        compile_program(parse("1 !a.x 2 !b.x a. !ptr")).execute(vm)
+        reader.execute(vm)
+
+        compile_program(parse("b. !ptr")).execute(vm)
+        reader.execute(vm)
+        self.assertEqual(vm.al, [1, 2])
+
+        compile_program(parse("Void !b.x.")).execute(vm)
+        with self.assertRaises(VMRuntimeError):
+            reader.execute(vm)
+
+    def test_store_path_cache_per_vm(self):
+        """Test one compiled Store read runs correctly on different VMs."""
+        reader = compile_program(parse("a.x"))
+        vm1 = VM(load_stdlib=False)
+        vm2 = VM(load_stdlib=False)
+        compile_program(parse("1 !a.x")).execute(vm1)
+        compile_program(parse("2 !a.x")).execute(vm2)
+
+        reader.execute(vm1)
+        reader.execute(vm2)
+        reader.execute(vm1)
+        self.assertEqual(vm1.al, [1, 1])
+        self.assertEqual(vm2.al, [2])
+
+    def test_extension_builtin_call_sees_reregistration(self):
+        """Test a compiled extension call picks up a re-registered builtin."""
+        vm = VM(load_stdlib=False)
+        vm.register_extension_builtin("use.test.f", lambda vm: vm.al.append(1))
+        caller = compile_program(parse(">use.test.f"))
+
+        caller.execute(vm)
+        vm.register_extension_builtin("use.test.f", lambda vm: vm.al.append(2))
+        caller.execute(vm)
+        self.assertEqual(vm.al, [1, 2])
+
     def test_store_read_cellref(self):
         """Test reading CellRef from Store."""
         vm = VM(load_stdlib=False)
@@ -1019,6 +1199,20 @@ class TestCellOperations(unittest.TestCase):
         # a.b.c is 99
         self.assertEqual(vm.store.read_value(["a", "b", "c"]), 99)
 
+    def test_replaced_cellref_no_longer_followed(self):
+        """Test a path stops following a CellRef once the Cell is replaced."""
+        vm = VM(load_stdlib=False)
+        vm.store.write_value(["data"], 1)
+        vm.store.write_value(["ref"], vm.store.read_ref(["data"]))
+        vm.store.write_value(["ref", "x"], 42)
+        self.assertEqual(vm.store.read_value(["data", "x"]), 42)
+
+        # Replacing ref's Cell drops the reference
+        vm.store.write_ref(["ref"], 5)
+        vm.store.write_value(["ref", "y"], 7)
+        self.assertIsNone(vm.store._get_cell(["data", "y"]))
+        self.assertEqual(vm.store.read_value(["ref", "y"]), 7)
+
     def test_int_with_children(self):
         """Test Int value can have children."""
         vm = VM(load_stdlib=False)
@@ -1191,6 +1385,19 @@ class TestRegisterLifecycle(unittest.TestCase):
         cellref = vm.al[0]
         self.assertEqual(cellref.cell.value, 42)
 
+    def test_reused_register_starts_empty(self):
+        """Test a Register reused from the pool keeps no earlier state."""
+        vm = VM(load_stdlib=False)
+
+        # The first block's CellRef escapes; the second block reuses its
+        # Register and writes the same path
+        vm.execute(compile_program(parse("{ 42 !_.data _.data. } >chain { 7 !_.data } >chain")))
+        self.assertEqual(vm.al[0].cell.value, 42)
+
+        # A later block cannot see an earlier block's _.data
+        with self.assertRaises(VMRuntimeError):
+            vm.execute(compile_program(parse("{ _.data } >chain")))
+
 
 class TestExamplesFromSpec(unittest.TestCase):
     """Tests based on examples from specification documents."""